@@ -36,6 +36,7 @@ def _emit(event: str, data: dict) -> None:
 
 _original_speak            = _tts_module.speak
 _original_speak_and_record = _tts_module.speak_and_record
+_original_speak_stream     = _tts_module.speak_stream
 
 
 def _patched_speak(text: str, rate: int = _tts_module.TTS_RATE) -> None:
@@ -52,8 +53,22 @@ def _patched_speak_and_record(text, recording_dir, recording_id, rate=_tts_modul
     return _original_speak_and_record(text, recording_dir, recording_id, rate)
 
 
+def _patched_speak_stream(chunks, rate=_tts_module.TTS_RATE):
+    if _stop_event.is_set():
+        return ""
+    # show the line as it is queued, sentence by sentence, then log it once
+    text = _original_speak_stream(
+        chunks, rate,
+        on_sentence=lambda so_far: _emit("system_speech", {"text": so_far, "type": "speak", "partial": True}),
+    )
+    if text:
+        _emit("system_speech", {"text": text, "type": "speak"})
+    return text
+
+
 _tts_module.speak            = _patched_speak
 _tts_module.speak_and_record = _patched_speak_and_record
+_tts_module.speak_stream     = _patched_speak_stream
 
 import robojec.pipeline.interview_runner as _runner
 import robojec.pipeline.user_info       as _user_info_module
@@ -62,11 +77,12 @@ import robojec.pipeline.user_info       as _user_info_module
 _original_save_response = _runner.save_response
 
 def _patched_save_response(response_dir, question, answer, recording_dir,
-                            recording_id, audio_data=None, question_audio_file=None):
+                            recording_id, audio_data=None, question_audio_file=None,
+                            **kwargs):
     global _current_session_csv
     result = _original_save_response(
         response_dir, question, answer, recording_dir,
-        recording_id, audio_data, question_audio_file
+        recording_id, audio_data, question_audio_file, **kwargs
     )
     csv_path = response_dir / "interview_responses.csv"
     if csv_path.exists():
@@ -77,7 +93,9 @@ _runner.save_response = _patched_save_response
 
 _runner.speak            = _patched_speak
 _runner.speak_and_record = _patched_speak_and_record
-_user_info_module.speak  = _patched_speak
+_runner.speak_stream     = _patched_speak_stream
+_user_info_module.speak        = _patched_speak
+_user_info_module.speak_stream = _patched_speak_stream
 
 
 # ── patch listen to emit state + check stop ────────────────────────────────────
@@ -141,9 +159,9 @@ _PIS.update_willingness_level = _patched_update_willingness
 _original_get_user_info = _user_info_module.get_user_info
 
 
-def _patched_get_user_info(client=None):
+def _patched_get_user_info(client=None, **kwargs):
     global _last_session_name
-    result = _original_get_user_info(client=client)
+    result = _original_get_user_info(client=client, **kwargs)
     if result:
         prof = result.get("profession_categories", {})
         name = result.get("display_name", result.get("name", ""))
@@ -254,6 +272,9 @@ def on_end_interview():
 # ── run ────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    from robojec.utils.asr import warm_up
+    warm_up(background=True)
+    _tts_module.start_tts()
     print("RoboJEC Web Interface")
     print("Open http://localhost:5000")
     socketio.run(app, host="0.0.0.0", port=5000, debug=False, allow_unsafe_werkzeug=True)
\ No newline at end of file
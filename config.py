@@ -6,28 +6,130 @@ load_dotenv()
 # ── Anthropic ──────────────────────────────────────────────────────────────────
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 CLAUDE_MODEL       = "claude-3-haiku-20240307"
+ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL", "")   # e.g. tools/fake_anthropic_server.py
+
+# ── LLM gateway ────────────────────────────────────────────────────────────────
+LLM_MAX_CONCURRENCY  = 4               # Claude requests in flight at once
+LLM_RETRIES          = 2               # extra attempts on timeouts / 429 / 5xx
+LLM_RETRY_BASE_DELAY = 0.25            # seconds; full jitter, doubled per attempt
+LLM_BREAKER_FAILURES = 3               # consecutive failures that open the breaker
+LLM_BREAKER_COOLDOWN = 30.0            # seconds of fallbacks before one trial call
+LLM_DEFAULT_DEADLINE = 6.0             # seconds per call site, retries included
+LLM_DEADLINES = {
+    # spoken in the conversation — keep the gap short
+    "opening":             4.0,
+    "acknowledgement":     3.0,
+    "name_retry":          3.0,
+    "profession_question": 4.0,
+    "welcome":             3.0,
+    "transition":          3.0,
+    "closing":             4.0,
+    "feedback_question":   4.0,
+    "rephrase":            3.0,
+    "question_picker":     3.0,
+    "followup":            4.0,
+    "hobby_intro":         4.0,
+    "hobby_discovery":     4.0,
+    # structured / background
+    "profession":          8.0,
+    "examples":            5.0,
+    "question_dataset":    90.0,
+}
+
+# Conversational lines are hedged: if Claude's first token takes longer than
+# the budget the fallback template is spoken instead and the late reply is
+# kept for the next identical prompt. Sites not listed are never hedged.
+LLM_HEDGE_BUDGETS = {
+    "acknowledgement":   0.6,
+    "name_retry":        0.6,
+    "welcome":           0.6,
+    "transition":        0.6,
+    "feedback_question": 0.6,
+    "closing":           0.6,
+}
+LLM_LATE_REPLIES = 64                  # late hedged replies kept for reuse
+
+# Replies to prompts that recur verbatim across sessions are cached on disk.
+# Only sites listed here are cached, each with its own time-to-live.
+LLM_CACHE_PATH        = "llm_cache.sqlite3"
+LLM_CACHE_MAX_ENTRIES = 5000           # least recently used replies evicted past this
+LLM_CACHE_TTLS = {
+    "name_retry":  7 * 24 * 3600,
+    "examples":   30 * 24 * 3600,
+    "rephrase":   30 * 24 * 3600,
+    "profession": 30 * 24 * 3600,
+}
 
 # ── Audio hardware ─────────────────────────────────────────────────────────────
 MIC_DEVICE_INDEX   = int(os.getenv("MIC_DEVICE_INDEX", 1))
-SAMPLE_RATE        = 44100
+SAMPLE_RATE        = 44100              # fallback device rate when 16 kHz is not supported
+NATIVE_16K_CAPTURE = True               # open the mic at WHISPER_TARGET_SR when the device allows
 CHUNK_SIZE         = 1024
+CAPTURE_BUFFER_SECONDS = 30.0           # ring buffer length of the always-open capture stream
 
 # ── Recording behaviour ────────────────────────────────────────────────────────
 SILENCE_THRESHOLD_ENERGY   = 2000       # raw PCM energy level
-SILENCE_THRESHOLD_DURATION = 3.5        # seconds of silence before stopping
+SILENCE_THRESHOLD_DURATION = 3.5        # longest silence tail before stopping (VAD usually closes earlier)
 NAME_SILENCE_DURATION      = 3.0        # shorter window for name capture
 MIN_SPEECH_DURATION        = 1.0        # seconds; ignore clips shorter than this
 MAX_RECORDING_DURATION     = 480        # 8 minutes hard cap per answer
 NAME_MAX_DURATION          = 180        # 3 minutes for name/intro capture
-NOISE_ADJUST_DURATION      = 1.0        # seconds to calibrate ambient noise
+
+# ── Voice-activity endpointing ─────────────────────────────────────────────────
+VAD_ONSET_FRAMES    = 3                 # consecutive voiced frames before speech counts
+VAD_MAX_SPEECH_ZCR  = 0.35              # quieter frames above this ZCR are treated as hiss
+VAD_END_HANGOVER    = 1.0               # seconds of silence after a clear sentence end
+VAD_PAUSE_EXTENSION = 0.5               # margin over recent pauses / extra after an abrupt stop
+VAD_RECENT_PAUSES   = 3                 # mid-turn pauses averaged to set the hangover
+VAD_MAX_HANGOVER    = 2.0               # cap on the adaptive hangover (well below the silence threshold)
+VAD_MIN_PAUSE       = 0.25              # silences shorter than this are not counted as pauses
+VAD_FALLING_RATIO   = 0.5               # tail/average energy below this marks a falling ending
+
+# ── Noise floor tracking ───────────────────────────────────────────────────────
+NOISE_FLOOR_WINDOW     = 20.0           # seconds of frame energies kept between turns
+NOISE_FLOOR_PERCENTILE = 20             # percentile of frame energy taken as the floor
+NOISE_FLOOR_MARGIN     = 6.0            # speech threshold = floor × margin (~8 dB)
+NOISE_FLOOR_MIN_FRAMES = 40             # frames needed before the estimate is trusted
 
 # ── TTS ────────────────────────────────────────────────────────────────────────
-TTS_RATE = 150                          # words per minute for pyttsx3
+TTS_RATE            = 150                 # words per minute for pyttsx3
+TTS_VOICE           = ""                  # pyttsx3 voice id; "" = engine default
+TTS_CACHE_DIR       = "tts_cache"         # rendered clips, keyed by (text, rate, voice)
+TTS_CACHE_MAX_BYTES = 500 * 1024 * 1024   # least recently used clips evicted past this
 
 # ── Whisper ────────────────────────────────────────────────────────────────────
 WHISPER_MODEL      = "openai/whisper-large-v3"
 WHISPER_LANGUAGE   = "en"
 WHISPER_TARGET_SR  = 16000             # Whisper expects 16 kHz
+ASR_DEVICE         = "cpu"
+ASR_COMPUTE_TYPE   = "int8"
+ASR_CPU_THREADS    = 0                 # CTranslate2 threads per model; 0 = library default
+
+# ── ASR routing ────────────────────────────────────────────────────────────────
+ASR_SHORT_MODEL        = "tiny"         # wake window, names, "repeat please"
+ASR_LONG_MODEL         = "base"         # answers; "small" trades latency for accuracy
+ASR_SHORT_MAX_DURATION = 4.0            # seconds of trimmed audio still routed to the short model
+
+# ── Short-utterance recognition (wake window, name, quick checks) ─────────────
+SHORT_UTTERANCE_ASR    = "whisper"     # "whisper" = local, works offline; "google" = Google Web Speech
+SHORT_UTTERANCE_PROMPT = ""            # Whisper initial_prompt; keep it free of names/jobs, which Whisper
+                                       # echoes on unclear audio ("" = no prompt)
+GOOGLE_SR_ENDPOINT     = "http://www.google.com/speech-api/v2/recognize"
+
+# ── Parallel ASR ───────────────────────────────────────────────────────────────
+ASR_PARALLEL_WORKERS      = 2          # concurrent decodes per model (num_workers); cores = workers × ASR_CPU_THREADS
+ASR_PARALLEL_MIN_DURATION = 30.0       # seconds; longer clips are split at pauses and decoded in parallel
+ASR_SEGMENT_MIN_DURATION  = 8.0        # seconds; don't cut a segment shorter than this
+ASR_SEGMENT_MAX_DURATION  = 28.0       # seconds; stay inside Whisper's 30 s window
+# Only used when STREAMING_ASR is False. Streamed answers are already split into
+# windows of at most STREAM_WINDOW_MAX_DURATION while recording, so their final
+# flush is always shorter than ASR_PARALLEL_MIN_DURATION.
+
+# ── Streaming ASR ──────────────────────────────────────────────────────────────
+STREAMING_ASR              = True       # transcribe closed windows while recording
+STREAM_WINDOW_MIN_DURATION = 6.0        # seconds; close a window at the next pause after this
+STREAM_WINDOW_MAX_DURATION = 20.0       # seconds; force-close a window without a pause
+ASR_TRIM_MARGIN            = 0.3        # seconds kept around the voiced span sent to ASR
 
 # ── Interview structure ────────────────────────────────────────────────────────
 PROFESSIONAL_QUESTION_COUNT = 6        # Phase 1 questions
@@ -37,6 +139,11 @@ FOLLOWUP_PROBABILITY        = 0.6      # chance of follow-up on long answer
 FOLLOWUP_MIN_WORDS          = 18       # answer must be at least this long
 MAX_RETRIES_LISTEN          = 2        # recording retry attempts
 
+# ── Kiosk mode ─────────────────────────────────────────────────────────────────
+KIOSK_WAKE_MIN_SPEECH = 0.6            # seconds of continuous voiced frames that wake the kiosk
+KIOSK_WAKE_PREROLL    = 1.0            # seconds before voice onset handed to the wake window
+KIOSK_COOLDOWN        = 5.0            # seconds after a session before listening for the next guest
+
 # ── Willingness thresholds ─────────────────────────────────────────────────────
 WILLINGNESS_LOW_THRESHOLD  = 30
 WILLINGNESS_HIGH_THRESHOLD = 70
@@ -2,15 +2,29 @@
 RoboJEC — Personality Interview System
 =======================================
 Usage:
-    python main.py
+    python main.py            # one interview, then exit
+    python main.py --kiosk    # resident loop, guest after guest
 
 RoboJEC listens silently for 5 seconds on startup.
 - Nothing heard → exits cleanly
 - Something heard → interview begins
 - Name mentioned in intro → used directly, no need to ask again
+
+In kiosk mode models stay loaded between guests; an energy gate waits for
+the next person to speak and the wake window starts from there.
 """
 
-from robojec.pipeline.interview_runner import run_interview
+import argparse
+
+from robojec.pipeline.interview_runner import run_interview, run_kiosk
 
 if __name__ == "__main__":
-    run_interview()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="RoboJEC personality interview")
+    parser.add_argument("--kiosk", action="store_true",
+                        help="keep running and interview guests back to back")
+    args = parser.parse_args()
+
+    if args.kiosk:
+        run_kiosk()
+    else:
+        run_interview()
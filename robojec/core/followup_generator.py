@@ -4,7 +4,7 @@ from typing import List, Optional
 
 from anthropic import Anthropic
 
-from config import CLAUDE_MODEL
+from robojec.utils.llm import complete
 
 
 class FollowUpGenerator:
@@ -39,6 +39,11 @@ class FollowUpGenerator:
         self.context_history = deque(maxlen=3)
         self.last_followup: Optional[str] = None
 
+    def reset(self) -> None:
+        """Forget the previous guest's answers."""
+        self.context_history.clear()
+        self.last_followup = None
+
     def generate_follow_up(
         self,
         candidate_response: str,
@@ -62,15 +67,12 @@ class FollowUpGenerator:
         context = "\n".join(f"- {r}" for r in self.context_history)
 
         try:
-            response = self.client.messages.create(
-                model=CLAUDE_MODEL,
+            question = complete(
+                self.client,
+                "followup",
+                self._PROMPT_TEMPLATE.format(context=context),
                 max_tokens=100,
-                messages=[{
-                    "role": "user",
-                    "content": self._PROMPT_TEMPLATE.format(context=context),
-                }],
-            )
-            question = response.content[0].text.strip()
+            ).strip()
             # strip leading numbering / quotes
             question = re.sub(r'^[\d."\']+\s*', "", question).strip()
 
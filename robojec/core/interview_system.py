@@ -1,6 +1,6 @@
 import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import random
@@ -31,7 +31,26 @@ class PersonalityInterviewSystem:
         self.followup_generator   = FollowUpGenerator(client)
         self.willingness_analyzer = WillingnessAnalyzer()
         self.conversation_starter = SamvadGenerator()
+        self.lock                 = threading.Lock()
+        self.session_id           = 0
+
+        self.reset_session(main_category, subcategory, hobby, user_context, user_field)
 
+    def reset_session(
+        self,
+        main_category: str,
+        subcategory: str,
+        hobby: str = "",
+        user_context: str = "professional",
+        user_field: str = "",
+    ) -> None:
+        """
+        Start a new guest on this instance. Generators and analyzers stay
+        loaded; everything learned about the previous guest is dropped.
+        Background jobs tagged with an earlier session_id are ignored.
+        """
+        with self.lock:
+            self.session_id += 1
         self.categories: Dict[str, str] = {
             "main":        main_category,
             "subcategory": subcategory,
@@ -43,8 +62,10 @@ class PersonalityInterviewSystem:
         self.user_field   = user_field
 
         self.asked_questions: set = set()
-        self.lock                 = threading.Lock()
         self.current_willingness  = WillingnessLevel.MEDIUM
+        self._reserved: Dict[str, Tuple[str, Dict]] = {}
+        self.followup_generator.reset()
+        self.question_generator.reset()
 
         self.available_datasets   = self._check_datasets()
         self.all_questions        = self._preload_questions()
@@ -81,8 +102,14 @@ class PersonalityInterviewSystem:
                 all_q.update(q["question"] for q in questions if "question" in q)
         return all_q
 
-    def update_available_datasets(self, category_type: str) -> None:
+    def is_current(self, session_id: Optional[int]) -> bool:
+        return session_id is None or session_id == self.session_id
+
+    def update_available_datasets(self, category_type: str, session_id: Optional[int] = None) -> None:
         with self.lock:
+            if not self.is_current(session_id):
+                print(f"  [System] Ignoring {category_type} dataset from an earlier session")
+                return
             self.available_datasets[category_type] = True
             print(f"  [System] Dataset now available: {category_type}")
 
@@ -104,14 +131,77 @@ class PersonalityInterviewSystem:
         if not cat_name:
             return self._default_question(willingness_level, category_type)
 
+        # a question drawn earlier by peek_question wins while still unasked
+        selected = self._reserved_question(category_type, cat_name)
+        if selected is None and self._dataset_ready(category_type):
+            new_qs   = self._unasked(category_type, willingness_level, cat_name)
+            selected = random.choice(new_qs) if new_qs else None
+        if selected is not None:
+            self._reserved.pop(category_type, None)
+            self.asked_questions.add(selected["question"])
+            self.category_question_counts[category_type] += 1
+            return {
+                "question_text":    selected["question"],
+                "category_type":    category_type,
+                "category_name":    cat_name,
+                "willingness_level": selected["willingness_level"],
+            }
+
+        return self._default_question(willingness_level, category_type)
+
+    def peek_question(
+        self,
+        category_type: str,
+        willingness_level: Optional[WillingnessLevel] = None,
+        category_name: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Draw and reserve the question get_question_by_category will return
+        next for this category, without asking it (so its audio can be
+        rendered ahead). `category_name` peeks at a category that is not
+        current yet (the next hobby); it is only used once its dataset is on
+        disk. None when the next question would be a default one.
+        """
+        if willingness_level is None:
+            willingness_level = self.current_willingness
+        cat_name = category_name or self.categories.get(category_type)
+        if not cat_name:
+            return None
+        reserved = self._reserved_question(category_type, cat_name)
+        if reserved is not None:
+            return reserved["question"]
+
+        if cat_name == self.categories.get(category_type):
+            ready = self._dataset_ready(category_type)
+        else:
+            ready = self.question_generator._file_path(category_type, cat_name).exists()
+        if not ready:
+            return None
+        new_qs = self._unasked(category_type, willingness_level, cat_name)
+        if not new_qs:
+            return None
+        selected = random.choice(new_qs)
+        self._reserved[category_type] = (cat_name, selected)
+        return selected["question"]
+
+    def _reserved_question(self, category_type: str, cat_name: str) -> Optional[Dict]:
+        """The peeked question for this category, if it is for `cat_name` and still unasked."""
+        name, question = self._reserved.get(category_type, ("", None))
+        if question is None or name != cat_name or question["question"] in self.asked_questions:
+            return None
+        return question
+
+    def _dataset_ready(self, category_type: str) -> bool:
         if not self.available_datasets.get(category_type, False):
-            fp = self.question_generator._file_path(category_type, cat_name)
+            fp = self.question_generator._file_path(category_type, self.categories[category_type])
             if fp.exists():
                 self.update_available_datasets(category_type)
+        return self.available_datasets.get(category_type, False)
 
-        if not self.available_datasets.get(category_type, False):
-            return self._default_question(willingness_level, category_type)
-
+    def _unasked(
+        self, category_type: str, willingness_level: WillingnessLevel, cat_name: str
+    ) -> List[Dict]:
+        """Unasked pool questions at the nearest level (rotating) that has any."""
         all_levels  = list(WillingnessLevel)
         start_index = all_levels.index(willingness_level)
 
@@ -126,17 +216,8 @@ class PersonalityInterviewSystem:
             )
             new_qs = [q for q in questions if q["question"] not in self.asked_questions]
             if new_qs:
-                selected = random.choice(new_qs)
-                self.asked_questions.add(selected["question"])
-                self.category_question_counts[category_type] += 1
-                return {
-                    "question_text":    selected["question"],
-                    "category_type":    category_type,
-                    "category_name":    cat_name,
-                    "willingness_level": selected["willingness_level"],
-                }
-
-        return self._default_question(willingness_level, category_type)
+                return new_qs
+        return []
 
     def get_hobby_question(
         self, willingness_level: Optional[WillingnessLevel] = None
@@ -5,8 +5,9 @@ from typing import Dict, List
 
 from anthropic import Anthropic
 
-from config import CLAUDE_MODEL, QUESTIONS_DIR, QUESTIONS_PER_CATEGORY
+from config import QUESTIONS_DIR, QUESTIONS_PER_CATEGORY
 from robojec.core.willingness_analyzer import WillingnessLevel
+from robojec.utils.llm import complete
 
 
 class PersonalityQuestionsGenerator:
@@ -152,6 +153,10 @@ class PersonalityQuestionsGenerator:
         self.questions_dir.mkdir(parents=True, exist_ok=True)
         self._used_defaults: set = set()
 
+    def reset(self) -> None:
+        """Make the default templates available again for a new guest."""
+        self._used_defaults.clear()
+
     # ── public API ─────────────────────────────────────────────────────────────
 
     def get_questions(
@@ -273,17 +278,16 @@ class PersonalityQuestionsGenerator:
                 "Questions should reflect their professional experience.\n\n"
             )
 
-        prompt   = self._PROMPTS.get(category_type, self._PROMPTS["main"])
-        response = self.client.messages.create(
-            model=CLAUDE_MODEL,
+        prompt = self._PROMPTS.get(category_type, self._PROMPTS["main"])
+        text   = complete(
+            self.client,
+            "question_dataset",
+            prompt.format(n=n, category=category, context_note=context_note),
             max_tokens=4000,
-            messages=[{"role": "user", "content": prompt.format(
-                n=n, category=category, context_note=context_note
-            )}],
         )
         return [
             line.strip()
-            for line in response.content[0].text.split("\n")
+            for line in text.split("\n")
             if line.strip() and "?" in line
         ]
 
@@ -314,14 +318,10 @@ class PersonalityQuestionsGenerator:
                 + "\n\nIMPORTANT: These must be COMPLETELY DIFFERENT from:\n"
                 + "\n".join(unique[:10])
             )
-            response = self.client.messages.create(
-                model=CLAUDE_MODEL,
-                max_tokens=4000,
-                messages=[{"role": "user", "content": extra_prompt}],
-            )
+            text   = complete(self.client, "question_dataset", extra_prompt, max_tokens=4000)
             extras = [
                 line.strip()
-                for line in response.content[0].text.split("\n")
+                for line in text.split("\n")
                 if line.strip() and "?" in line
             ]
             unique = list(set(unique + self._filter_similar(extras, unique)))
@@ -8,6 +8,8 @@ from nltk.chunk import ne_chunk
 from nltk.tag import pos_tag
 from nltk.tokenize import word_tokenize
 
+from robojec.utils.llm import complete
+
 for _res, _path in [
     ("punkt",             "tokenizers/punkt"),
     ("maxent_ne_chunker", "chunkers/maxent_ne_chunker"),
@@ -135,19 +137,16 @@ class SamvadGenerator:
         """
         if client is not None:
             try:
-                response = client.messages.create(
-                    model="claude-3-haiku-20240307",
+                q = complete(
+                    client,
+                    "hobby_discovery",
+                    (
+                        f"Generate one natural, professional question to ask {name} "
+                        "about their hobbies or interests outside of work. "
+                        "8-15 words. Warm but not casual. Return only the question."
+                    ),
                     max_tokens=60,
-                    messages=[{
-                        "role": "user",
-                        "content": (
-                            f"Generate one natural, professional question to ask {name} "
-                            "about their hobbies or interests outside of work. "
-                            "8-15 words. Warm but not casual. Return only the question."
-                        )
-                    }]
-                )
-                q = response.content[0].text.strip().strip('"')
+                ).strip().strip('"')
                 if q and "?" in q:
                     return q
             except Exception:
@@ -5,7 +5,7 @@ import librosa
 import numpy as np
 
 from config import (
-    SAMPLE_RATE,
+    WHISPER_TARGET_SR,
     WILLINGNESS_HIGH_THRESHOLD,
     WILLINGNESS_LOW_THRESHOLD,
 )
@@ -33,7 +33,8 @@ class WillingnessAnalyzer:
     _ENGAGE_WEIGHT    = 0.40
 
     def __init__(self) -> None:
-        self.sample_rate = SAMPLE_RATE
+        # recordings are always delivered at the Whisper rate (see capture.py)
+        self.sample_rate = WHISPER_TARGET_SR
 
     # ── public entry point ─────────────────────────────────────────────────────
 
@@ -14,9 +14,12 @@ from anthropic import Anthropic
 
 from config import (
     ANTHROPIC_API_KEY,
+    ANTHROPIC_BASE_URL,
     FOLLOWUP_MIN_WORDS,
     FOLLOWUP_PROBABILITY,
+    KIOSK_COOLDOWN,
     HOBBY_QUESTION_COUNT,
+    MIN_SPEECH_DURATION,
     PROFESSIONAL_QUESTION_COUNT,
     QUESTIONS_DIR,
     RESPONSES_DIR,
@@ -25,14 +28,23 @@ from robojec.core.interview_system import PersonalityInterviewSystem
 from robojec.core.question_generator import PersonalityQuestionsGenerator
 from robojec.core.willingness_analyzer import WillingnessLevel
 from robojec.pipeline.user_info import get_user_info
-from robojec.utils.audio import MetaRequest, listen_and_save, listen_and_save_name
+from robojec.utils.audio import (
+    MetaRequest,
+    last_endpoint,
+    listen_and_save,
+    open_capture,
+    wait_for_voice,
+)
+from robojec.utils.asr import reset_route_stats, route_stats, warm_up
+from robojec.utils.capture import stop_capture_service
 from robojec.utils.text_utils import (
     check_star,
     extract_hobbies,
     extract_keywords,
     identify_themes,
 )
-from robojec.utils.tts import speak, speak_and_record
+from robojec.utils.llm import circuit_open, complete, hedged_complete, hedged_stream, reset_site_stats, site_stats
+from robojec.utils.tts import last_render, prefetch, speak, speak_and_record, speak_stream, start_tts
 
 
 # ── background dataset generation ─────────────────────────────────────────────
@@ -43,15 +55,22 @@ def generate_dataset_background(
     category_name: str,
     system: PersonalityInterviewSystem,
     ready_event: Optional[threading.Event] = None,
+    session_id: Optional[int] = None,
 ) -> None:
+    """
+    Generate one dataset off the conversation path. `session_id` ties the
+    job to the guest it was started for; a kiosk session that has moved on
+    to the next guest by the time it finishes ignores the result.
+    """
     try:
         print(f"  [BG] Generating {category_type}:{category_name} …")
         questions = question_generator._generate(category_type, category_name, 75)
         if questions:
-            with threading.Lock():
-                for q in questions:
-                    system.all_questions.add(q["question"])
-            system.update_available_datasets(category_type)
+            with system.lock:
+                if system.is_current(session_id):
+                    for q in questions:
+                        system.all_questions.add(q["question"])
+            system.update_available_datasets(category_type, session_id)
             print(f"  [BG] Done — {category_type}:{category_name}")
         else:
             print(f"  [BG] No questions for {category_type}:{category_name}")
@@ -72,6 +91,7 @@ def save_response(
     recording_id: str,
     audio_data: Optional[np.ndarray] = None,
     question_audio_file: Optional[Path] = None,
+    asr_trim: Optional[List[float]] = None,
 ) -> float:
     try:
         word_count     = len(answer.split()) if answer else 0
@@ -120,9 +140,10 @@ def save_response(
                 writer.writeheader()
             writer.writerow(record)
 
+        # [start, end] seconds of the recording that was sent to ASR
         json_path = response_dir / f"{recording_id}_response.json"
         with open(json_path, "w", encoding="utf-8") as fh:
-            json.dump(record, fh, indent=2)
+            json.dump({**record, "asr_trim": asr_trim}, fh, indent=2)
 
         return time_spent
 
@@ -149,19 +170,16 @@ def _get_rephrased(question_text: str, client: Optional[Anthropic]) -> str:
     """Ask Claude to rephrase a question more simply. Returns original on failure."""
     if client:
         try:
-            resp = client.messages.create(
-                model="claude-3-haiku-20240307",
+            rephrased = complete(
+                client,
+                "rephrase",
+                (
+                    f"Rephrase this interview question in simpler, clearer language. "
+                    f"Plain everyday words. Keep it 8-15 words. "
+                    f"Return only the rephrased question:\n{question_text}"
+                ),
                 max_tokens=60,
-                messages=[{
-                    "role": "user",
-                    "content": (
-                        f"Rephrase this interview question in simpler, clearer language. "
-                        f"Plain everyday words. Keep it 8-15 words. "
-                        f"Return only the rephrased question:\n{question_text}"
-                    )
-                }]
-            )
-            rephrased = resp.content[0].text.strip().strip('"')
+            ).strip().strip('"')
             if rephrased and "?" in rephrased:
                 return rephrased
         except Exception:
@@ -176,6 +194,8 @@ def _listen_with_meta_handling(
     client: Optional[Anthropic],
     silence_threshold: float = 3.5,
     max_meta_retries: int = 3,
+    min_speech_duration: float = MIN_SPEECH_DURATION,
+    min_words: int = 3,
 ):
     """
     Listen for an answer. If repeat/rephrase requested, handle it and listen again.
@@ -196,6 +216,8 @@ def _listen_with_meta_handling(
             recording_dir=recording_dir,
             question_id=question_id,
             silence_threshold=silence_threshold,
+            min_speech_duration=min_speech_duration,
+            min_words=min_words,
         )
         answer, audio_data, proc_end = result
 
@@ -253,31 +275,28 @@ def _generate_hobby_intro(
     """
     if client:
         try:
-            resp = client.messages.create(
-                model="claude-3-haiku-20240307",
+            text = complete(
+                client,
+                "hobby_intro",
+                (
+                    f"{display_name} said this about their hobbies: \"{hobby_answer}\"\n\n"
+                    "Do two things:\n"
+                    "1. Write one warm, natural transition sentence moving into hobby questions. "
+                    "Sound like a curious person, not a list reader. "
+                    "Do NOT list hobbies back verbatim. "
+                    "Do NOT mention office, workplace, or work. "
+                    "Must work for anyone — student, retiree, professional. "
+                    "Examples: \n"
+                    "  - 'That sounds like a wonderful mix of interests — I'd love to explore them.' \n"
+                    "  - 'How lovely to have such varied passions in life.'\n"
+                    "2. List the distinct hobbies as SHORT clean nouns or gerunds (1-3 words each). "
+                    "Maximum 3 hobbies. No sentences. No commentary.\n\n"
+                    "Respond in EXACTLY this format:\n"
+                    "INTRO: <one sentence>\n"
+                    "HOBBIES: <hobby1>, <hobby2>"
+                ),
                 max_tokens=150,
-                messages=[{
-                    "role": "user",
-                    "content": (
-                        f"{display_name} said this about their hobbies: \"{hobby_answer}\"\n\n"
-                        "Do two things:\n"
-                        "1. Write one warm, natural transition sentence moving into hobby questions. "
-                        "Sound like a curious person, not a list reader. "
-                        "Do NOT list hobbies back verbatim. "
-                        "Do NOT mention office, workplace, or work. "
-                        "Must work for anyone — student, retiree, professional. "
-                        "Examples: \n"
-                        "  - 'That sounds like a wonderful mix of interests — I'd love to explore them.' \n"
-                        "  - 'How lovely to have such varied passions in life.'\n"
-                        "2. List the distinct hobbies as SHORT clean nouns or gerunds (1-3 words each). "
-                        "Maximum 3 hobbies. No sentences. No commentary.\n\n"
-                        "Respond in EXACTLY this format:\n"
-                        "INTRO: <one sentence>\n"
-                        "HOBBIES: <hobby1>, <hobby2>"
-                    )
-                }]
-            )
-            text     = resp.content[0].text.strip()
+            ).strip()
             intro    = ""
             hobbies  = []
             for line in text.splitlines():
@@ -367,24 +386,20 @@ def _pick_intelligent_question(
             for t in conversation_history[-4:]
         )
 
-        resp = client.messages.create(
-            model="claude-3-haiku-20240307",
+        new_q = complete(
+            client,
+            "question_picker",
+            _QUESTION_PICKER_PROMPT.format(
+                name=user_info.get("display_name", user_info.get("name", "")),
+                field=prof_cats.get("field", ""),
+                role=prof_cats.get("subcategory", ""),
+                context=prof_cats.get("context", "professional"),
+                seniority=prof_cats.get("seniority", ""),
+                history=history_text,
+                candidate=candidate["question_text"],
+            ),
             max_tokens=80,
-            messages=[{
-                "role": "user",
-                "content": _QUESTION_PICKER_PROMPT.format(
-                    name=user_info.get("display_name", user_info.get("name", "")),
-                    field=prof_cats.get("field", ""),
-                    role=prof_cats.get("subcategory", ""),
-                    context=prof_cats.get("context", "professional"),
-                    seniority=prof_cats.get("seniority", ""),
-                    history=history_text,
-                    candidate=candidate["question_text"],
-                )
-            }]
-        )
-
-        new_q = resp.content[0].text.strip().strip('"')
+        ).strip().strip('"')
         if new_q and "?" in new_q and 5 <= len(new_q.split()) <= 20:
             return {**candidate, "question_text": new_q}
 
@@ -401,9 +416,15 @@ def ask_feedback_question(
     response_dir: Path,
     recording_dir: Path,
     client: Optional[Anthropic] = None,
+    system: Optional[PersonalityInterviewSystem] = None,
 ) -> None:
+    """
+    Closing reflective question. The answer can run for minutes, so it goes
+    through the same streaming faster-whisper path as every other answer.
+    """
     feedback_q = _claude_text_local(
         client,
+        "feedback_question",
         prompt=(
             f"Generate one closing question to ask {display_name} at the end of a personality interview. "
             "Something reflective — like advice they'd give, or wisdom they'd share. "
@@ -419,12 +440,9 @@ def ask_feedback_question(
     feedback_audio_file, _ = speak_and_record(feedback_q, recording_dir, "feedback_question")
 
     print("\nListening for your answer…")
-    feedback_text, feedback_audio = listen_and_save_name(
-        recording_dir=recording_dir,
-        question_id="feedback",
-        silence_threshold=3.0,
-        min_speech_duration=1.5,
-        max_recording_duration=480,
+    feedback_text, feedback_audio, _ = _listen_with_meta_handling(
+        feedback_q, recording_dir, "feedback", client, silence_threshold=3.0,
+        min_speech_duration=1.5, min_words=1,   # short reflective answers ("Be kind.") count
     )
 
     if feedback_text and feedback_text.lower() != "quit":
@@ -441,24 +459,41 @@ def ask_feedback_question(
             "feedback",
             feedback_audio,
             feedback_audio_file,
+            asr_trim=last_endpoint().get("asr_trim"),
         )
+    if system is not None and feedback_audio is not None and len(feedback_audio) > 0:
+        system.update_willingness_level(feedback_audio)
 
 
 def _claude_text_local(
-    client: Optional[Anthropic], prompt: str,
-    max_tokens: int = 80, fallback: str = ""
+    client: Optional[Anthropic], site: str, prompt: str,
+    max_tokens: int = 80, fallback: str = "", say: bool = False,
 ) -> str:
+    """
+    say=True streams the reply straight into speech, sentence by sentence,
+    and returns what was spoken (the fallback is spoken if nothing arrives).
+    Hedged sites (LLM_HEDGE_BUDGETS) use the fallback when Claude is slow.
+    """
+    if say:
+        text = ""
+        if client is not None:
+            try:
+                deltas = hedged_stream(client, site, prompt, max_tokens)
+            except Exception:
+                deltas = None
+            if deltas is not None:
+                text = speak_stream(chunk.replace('"', "") for chunk in deltas)
+        if not text:
+            text = fallback
+            speak(text)
+        return text
     if client is None:
         return fallback
     try:
-        resp = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        return resp.content[0].text.strip().strip('"')
+        text = hedged_complete(client, site, prompt, max_tokens)
     except Exception:
         return fallback
+    return fallback if text is None else text.strip().strip('"')
 
 
 # ── timing helpers ─────────────────────────────────────────────────────────────
@@ -486,6 +521,9 @@ def _write_timing_csv(
                 "Question Prep"   if "prep" in name
                 else "First Byte" if "first_byte" in name
                 else "Response End" if "response_end" in name
+                else "Endpoint" if "endpoint" in name
+                else "Speech End" if "speech_end" in name
+                else "TTS" if "tts_" in name
                 else "Gap" if "gap" in name
                 else "Other"
             )
@@ -499,14 +537,104 @@ def _write_timing_csv(
             writer.writerow([label, "avg", f"{statistics.mean(gaps):.3f}"])
             writer.writerow([label, "max", f"{max(gaps):.3f}"])
             writer.writerow([label, "min", f"{min(gaps):.3f}"])
+        tts = _tts_prefetch_stats(timings)
+        if tts:
+            writer.writerow(["TTS Prefetch", "hit_rate", f"{tts['hit_rate']:.3f}"])
+            writer.writerow(["TTS Prefetch", "saved", f"{tts['saved']:.3f}"])
+        routes = route_stats()
+        if routes:
+            writer.writerow([])
+            writer.writerow(["ASR Route", "Model", "Calls", "Audio", "Avg Latency", "RTF"])
+            for route, s in routes.items():
+                writer.writerow([route, s["model"], s["calls"], f"{s['audio']:.3f}",
+                                 f"{s['avg_latency']:.3f}", f"{s['rtf']:.3f}"])
+        sites = site_stats()
+        if sites:
+            writer.writerow([])
+            writer.writerow(["LLM Site", "Calls", "Templates", "Late Reused",
+                             "Cache Hits", "Cache Misses", "Joined", "Hit Ratio", "Saved"])
+            for site, s in sorted(sites.items()):
+                writer.writerow([site, s["calls"], s["templates"], s["late_reused"],
+                                 s["hits"], s["misses"], s["joined"],
+                                 f"{s['hit_ratio']:.3f}", f"{s['saved']:.3f}"])
+
+
+def _record_endpoint(
+    timings: List[Tuple], prefix: str = "", processing_end: Optional[float] = None
+) -> None:
+    """
+    Log the VAD end-of-turn decision of the last answer for tuning (trailing
+    silence, allowed hangover, falling ending 1/0, pause count), plus the
+    sample-clock time the guest actually stopped speaking.
+    """
+    ep = last_endpoint()
+    if not ep:
+        return
+    timings.append((f"{prefix}endpoint_{ep['reason']}", ep["trailing_silence"]))
+    timings.append((f"{prefix}endpoint_hangover", ep["hangover"]))
+    timings.append((f"{prefix}endpoint_falling", float(ep["falling"])))
+    timings.append((f"{prefix}endpoint_pauses", float(ep["pauses"])))
+    if "speech_end" in ep:
+        timings.append((f"{prefix}speech_end", ep["speech_end"]))
+        if processing_end:
+            timings.append((f"{prefix}speech_to_text_gap", processing_end - ep["speech_end"]))
+
+
+def _record_tts(timings: List[Tuple], prefix: str = "") -> None:
+    """Log how the last question's audio was served and the render time saved."""
+    info = last_render()
+    if info:
+        timings.append((f"{prefix}tts_{info['source']}", info["saved"]))
+
+
+def _prefetch_next(
+    system: PersonalityInterviewSystem,
+    category_type: str,
+    level: WillingnessLevel,
+    category_name: Optional[str] = None,
+) -> None:
+    """
+    Render the next question's audio while the guest answers. The candidate
+    is drawn and reserved now, so it is the one asked next whatever level
+    the answer produces: one background render, which a foreground line
+    never waits long behind.
+    """
+    text = system.peek_question(category_type, level, category_name)
+    if text:
+        prefetch(text)
+
 
+def _tts_prefetch_stats(timings: List[Tuple]) -> Dict[str, float]:
+    served = [(name, v) for name, v in timings if "tts_" in name]
+    if not served:
+        return {}
+    hits = [v for name, v in served if name.endswith("tts_prefetch")]
+    return {
+        "hit_rate": len(hits) / len(served),
+        "saved":    sum(v for _, v in served),
+    }
 
-def _print_timing_stats(all_gaps, prof_gaps, hobby_gaps):
+
+def _print_timing_stats(all_gaps, prof_gaps, hobby_gaps, timings=None):
     for label, gaps in [("Overall", all_gaps), ("Professional", prof_gaps), ("Hobby", hobby_gaps)]:
         if not gaps:
             continue
         print(f"\n  ⏱ {label} — avg={statistics.mean(gaps):.2f}s  "
               f"max={max(gaps):.2f}s  min={min(gaps):.2f}s")
+    for route, s in route_stats().items():
+        print(f"  ⏱ ASR {route} ({s['model']}) — {s['calls']} calls  "
+              f"avg={s['avg_latency']:.2f}s  RTF={s['rtf']:.2f}")
+    tts = _tts_prefetch_stats(timings or [])
+    if tts:
+        print(f"  ⏱ TTS prefetch — hit rate {tts['hit_rate']:.0%}  "
+              f"saved {tts['saved'] * 1000:.0f} ms")
+    for site, s in sorted(site_stats().items()):
+        if s["templates"] or s["late_reused"]:
+            print(f"  ⏱ LLM {site} — {s['templates']} template(s) on a missed budget, "
+                  f"{s['late_reused']} late reply reused")
+        if s["hits"] or s["misses"]:
+            print(f"  ⏱ LLM cache {site} — hit ratio {s['hit_ratio']:.0%}  "
+                  f"saved {s['saved'] * 1000:.0f} ms")
 
 
 # ── maybe follow-up ────────────────────────────────────────────────────────────
@@ -559,6 +687,7 @@ def _maybe_followup(
         follow_up, recording_dir, f"q{question_count}_followup", client
     )
     timings.append(("followup_end", fu_end))
+    _record_endpoint(timings, "followup_", fu_end)
 
     if fu_answer and fu_answer.lower() == "quit":
         return "quit", fu_end, True
@@ -581,14 +710,16 @@ def conduct_interview(
 
     welcome = _claude_text_local(
         client,
+        "welcome",
         prompt=(
             f"Generate one warm sentence welcoming {display_name} to the interview "
             "and saying you'll begin now. Professional, not over the top. "
             "Return only the sentence."
         ),
         fallback=f"Wonderful, {display_name}. Let's begin our conversation.",
+        say=True,
     )
-    print(f"\n{welcome}"); speak(welcome)
+    print(f"\n{welcome}")
 
     instructions = (
         "I'll ask you some questions to get to know you better. "
@@ -638,6 +769,11 @@ def conduct_interview(
                 f"q{question_count}_prof_question"
             )
             timings.append(("first_byte", first_byte))
+            _record_tts(timings)
+            # a live picker rewrites the next question; without one (no client,
+            # or the API is down) the pool candidate is asked as drawn
+            if seq_idx < PROFESSIONAL_QUESTION_COUNT - 1 and (client is None or circuit_open()):
+                _prefetch_next(system, "subcategory", willingness_level)
 
             if last_response_end:
                 gap = first_byte - last_response_end
@@ -652,6 +788,8 @@ def conduct_interview(
             )
             last_response_end = proc_end
             timings.append(("response_end", proc_end))
+            _record_endpoint(timings, "", proc_end)
+            asr_trim = last_endpoint().get("asr_trim")
 
             if answer and answer.lower() == "quit":
                 _end_interview(display_name); return
@@ -671,7 +809,7 @@ def conduct_interview(
 
             save_response(response_dir, question, full_answer,
                           recording_dir, f"q{question_count}_prof",
-                          audio_data, q_audio)
+                          audio_data, q_audio, asr_trim=asr_trim)
 
             conversation_history.append({
                 "question": question["question_text"],
@@ -689,8 +827,10 @@ def conduct_interview(
 
         # natural transition from professional phase to personal interests
         # one warm sentence before asking the hobby question
+        time.sleep(1.0)
         p2_transition = _claude_text_local(
             client,
+            "transition",
             prompt=(
                 f"Generate one short, warm sentence to transition into asking {display_name} "
                 "about their personal interests or hobbies. "
@@ -705,10 +845,9 @@ def conduct_interview(
                 "Keep it natural, 10-18 words. Return only the sentence."
             ),
             fallback=f"I'd also love to learn a bit about your interests and passions, {display_name}.",
+            say=True,
         )
-        time.sleep(1.0)
         print(f"\n  {p2_transition}")
-        speak(p2_transition)
         time.sleep(0.5)
 
         hobby_q = system.conversation_starter.generate_hobby_discovery_question(
@@ -724,6 +863,8 @@ def conduct_interview(
         )
         last_response_end = hobby_end
         timings.append(("hobby_response_end", hobby_end))
+        _record_endpoint(timings, "hobby_discovery_", hobby_end)
+        hobby_trim = last_endpoint().get("asr_trim")
 
         if hobby_answer and hobby_answer.lower() == "quit":
             _end_interview(display_name); return
@@ -734,6 +875,7 @@ def conduct_interview(
              "question_text": hobby_q, "willingness_level": str(willingness_level).lower()},
             hobby_answer if hobby_answer else "[No response]",
             recording_dir, "hobby_discovery", hobby_audio, hq_audio,
+            asr_trim=hobby_trim,
         )
 
         # ══════════════════════════════════════════════════════════════════════
@@ -763,7 +905,7 @@ def conduct_interview(
                 dataset_events[hobby] = evt
                 threading.Thread(
                     target=generate_dataset_background,
-                    args=(system.question_generator, "hobby", hobby, system, evt),
+                    args=(system.question_generator, "hobby", hobby, system, evt, system.session_id),
                     daemon=True,
                 ).start()
 
@@ -795,6 +937,9 @@ def conduct_interview(
                     f"q{question_count}_hobby_question"
                 )
                 timings.append((f"hobby_q{i+1}_first_byte", hq_first))
+                _record_tts(timings, f"hobby_q{i+1}_")
+                if i < HOBBY_QUESTION_COUNT - 1:
+                    _prefetch_next(system, "hobby", willingness_level, hobby_plan[i + 1])
 
                 if i > 0 and hobby_last_end:
                     gap = hq_first - hobby_last_end
@@ -810,6 +955,8 @@ def conduct_interview(
                 hobby_last_end    = proc_end
                 last_response_end = proc_end
                 timings.append((f"hobby_q{i+1}_response_end", proc_end))
+                _record_endpoint(timings, f"hobby_q{i+1}_", proc_end)
+                asr_trim = last_endpoint().get("asr_trim")
 
                 if answer and answer.lower() == "quit":
                     _end_interview(display_name); return
@@ -817,7 +964,7 @@ def conduct_interview(
                 save_response(response_dir, question,
                               answer if answer else "[No response]",
                               recording_dir, f"q{question_count}_hobby",
-                              audio_data, hq_file)
+                              audio_data, hq_file, asr_trim=asr_trim)
 
                 if audio_data is not None and len(audio_data) > 0:
                     willingness_level, _ = system.update_willingness_level(audio_data)
@@ -828,13 +975,14 @@ def conduct_interview(
         elapsed = time.time() - start_time
         print(f"\nInterview complete — {int(elapsed//60)}m {int(elapsed%60)}s | "
               f"{question_count} questions")
-        _print_timing_stats(all_gaps, prof_gaps, hobby_gaps)
+        _print_timing_stats(all_gaps, prof_gaps, hobby_gaps, timings)
         _write_timing_csv(response_dir, timings, all_gaps, prof_gaps, hobby_gaps)
 
-        ask_feedback_question(display_name, response_dir, recording_dir, client)
+        ask_feedback_question(display_name, response_dir, recording_dir, client, system)
 
         closing = _claude_text_local(
             client,
+            "closing",
             prompt=(
                 f"Generate a warm 1-2 sentence closing thanking {display_name} "
                 "for participating in a personality and interests interview (like a podcast). "
@@ -843,8 +991,9 @@ def conduct_interview(
                 "Professional but personal tone. Return only the sentences."
             ),
             fallback=f"Thank you so much for your time, {display_name}. It has been a genuine pleasure speaking with you.",
+            say=True,
         )
-        print(f"\n{closing}"); speak(closing)
+        print(f"\n{closing}")
         time.sleep(1)
 
         outro = (
@@ -858,7 +1007,7 @@ def conduct_interview(
         print("\nInterview interrupted.")
         elapsed = time.time() - start_time
         print(f"Completed {question_count} questions in {int(elapsed//60)}m {int(elapsed%60)}s")
-        _print_timing_stats(all_gaps, prof_gaps, hobby_gaps)
+        _print_timing_stats(all_gaps, prof_gaps, hobby_gaps, timings)
         _write_timing_csv(response_dir, timings, all_gaps, prof_gaps, hobby_gaps, interrupted=True)
 
 
@@ -869,12 +1018,72 @@ def run_interview(api_key: Optional[str] = None) -> None:
     if not key:
         key = input("Enter your Anthropic API key: ").strip()
 
-    client    = Anthropic(api_key=key)
-    user_info = get_user_info(client=client)
+    client = Anthropic(api_key=key, base_url=ANTHROPIC_BASE_URL or None)
+
+    # load + warm Whisper while the wake window runs; TTS engine comes up once
+    warm_up(background=True)
+    start_tts()
+
+    # microphone is opened once and stays open for the whole session;
+    # the noise floor is tracked from here on, so no per-turn calibration
+    open_capture()
+    try:
+        _run_session(client)
+    finally:
+        stop_capture_service()
+
+
+def run_kiosk(api_key: Optional[str] = None) -> None:
+    """
+    Resident kiosk loop: one process serves guest after guest.
+
+    Models, the Anthropic client and the open microphone stay warm between
+    sessions. While idle only a cheap energy gate runs; when it fires, the
+    wake window picks up from just before the guest started talking.
+    """
+    key = api_key or ANTHROPIC_API_KEY
+    if not key:
+        key = input("Enter your Anthropic API key: ").strip()
+
+    client = Anthropic(api_key=key, base_url=ANTHROPIC_BASE_URL or None)
+    warm_up()
+    start_tts()
+    open_capture()
+
+    system: Optional[PersonalityInterviewSystem] = None
+    try:
+        while True:
+            print("\n  [Kiosk] Waiting for the next guest…")
+            cursor = wait_for_voice()
+            reset_route_stats()
+            reset_site_stats()
+            try:
+                system = _run_session(client, system, wake_cursor=cursor)
+            except KeyboardInterrupt:
+                raise
+            except Exception as exc:
+                print(f"  [Kiosk] Session error: {exc}")
+            time.sleep(KIOSK_COOLDOWN)
+    except KeyboardInterrupt:
+        print("\n  [Kiosk] Shutting down.")
+    finally:
+        stop_capture_service()
+
+
+def _run_session(
+    client: Anthropic,
+    system: Optional[PersonalityInterviewSystem] = None,
+    wake_cursor: Optional[int] = None,
+) -> Optional[PersonalityInterviewSystem]:
+    """
+    One guest, from wake window to outro. Reuses `system` (reset for the new
+    guest) when given; returns the system used, or None if nobody spoke.
+    """
+    user_info = get_user_info(client=client, wake_cursor=wake_cursor)
 
     if user_info is None:
-        print("  [RoboJEC] No activation detected. Goodbye.")
-        return
+        print("  [RoboJEC] No activation detected.")
+        return system
 
     questions_dir = Path(QUESTIONS_DIR)
     questions_dir.mkdir(parents=True, exist_ok=True)
@@ -895,20 +1104,25 @@ def run_interview(api_key: Optional[str] = None) -> None:
             print(f"  ✗ {cat_type}: {cat_name} — generating in background")
             datasets_to_gen.append((cat_type, cat_name))
 
-    system = PersonalityInterviewSystem(
-        client=client,
-        questions_dir=questions_dir,
-        main_category=main_cat,
-        subcategory=subcategory,
-        hobby="",
-        user_context=user_info.get("context", "professional"),
-        user_field=user_info.get("profession_categories", {}).get("field", ""),
-    )
+    user_context = user_info.get("context", "professional")
+    user_field   = user_info.get("profession_categories", {}).get("field", "")
+    if system is None:
+        system = PersonalityInterviewSystem(
+            client=client,
+            questions_dir=questions_dir,
+            main_category=main_cat,
+            subcategory=subcategory,
+            hobby="",
+            user_context=user_context,
+            user_field=user_field,
+        )
+    else:
+        system.reset_session(main_cat, subcategory, "", user_context, user_field)
 
     for cat_type, cat_name in datasets_to_gen:
         threading.Thread(
             target=generate_dataset_background,
-            args=(qgen, cat_type, cat_name, system),
+            args=(qgen, cat_type, cat_name, system, None, system.session_id),
             daemon=True,
         ).start()
 
@@ -919,6 +1133,7 @@ def run_interview(api_key: Optional[str] = None) -> None:
         client=client,
         user_info=user_info,
     )
+    return system
 
 
 # ── helpers ────────────────────────────────────────────────────────────────────
@@ -13,37 +13,62 @@ from robojec.utils.profession import (
     generate_specialisation_examples,
     recognize_profession,
 )
+from robojec.utils.llm import hedged_complete, hedged_stream
 from robojec.utils.text_utils import extract_number_from_text
-from robojec.utils.tts import speak
+from robojec.utils.tts import speak, speak_stream
 
 
 # ── single Claude text helper ──────────────────────────────────────────────────
 
 def _claude_text(
     client: Optional[Anthropic],
+    site: str,
     prompt: str,
     max_tokens: int = 80,
     fallback: str = "",
+    say: bool = False,
 ) -> str:
+    """
+    say=True streams the reply straight into speech, sentence by sentence,
+    and returns what was spoken (the fallback is spoken if nothing arrives).
+    Hedged sites (LLM_HEDGE_BUDGETS) use the fallback when Claude is slow.
+    """
+    if say:
+        return _claude_say(client, site, prompt, max_tokens, fallback)
     if client is None:
         return fallback
     try:
-        resp = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        return resp.content[0].text.strip().strip('"')
+        text = hedged_complete(client, site, prompt, max_tokens)
     except Exception as exc:
         print(f"  [Claude] Call failed: {exc}")
         return fallback
+    return fallback if text is None else text.strip().strip('"')
+
+
+def _claude_say(
+    client: Optional[Anthropic], site: str, prompt: str, max_tokens: int, fallback: str
+) -> str:
+    text = ""
+    if client is not None:
+        try:
+            deltas = hedged_stream(client, site, prompt, max_tokens)
+        except Exception as exc:
+            print(f"  [Claude] Call failed: {exc}")
+            deltas = None
+        if deltas is not None:
+            text = speak_stream(chunk.replace('"', "") for chunk in deltas)
+    if not text:
+        text = fallback
+        speak(text)
+    return text
 
 
 # ── opening sequence generators ───────────────────────────────────────────────
 
-def _generate_opening(client: Optional[Anthropic]) -> str:
+def _generate_opening(client: Optional[Anthropic], say: bool = False) -> str:
     return _claude_text(
         client,
+        "opening",
         prompt=(
             "You are RoboJEC, an AI interview system. "
             "Generate a warm, professional 2-3 sentence opening to start a personality interview. "
@@ -59,23 +84,27 @@ def _generate_opening(client: Optional[Anthropic]) -> str:
             "Hello, welcome to RoboJEC. I'm an AI system designed for meaningful conversations. "
             "It's wonderful to have you here today. Before we begin, may I have your name?"
         ),
+        say=say,
     )
 
 
-def _generate_name_retry(client: Optional[Anthropic]) -> str:
+def _generate_name_retry(client: Optional[Anthropic], say: bool = False) -> str:
     return _claude_text(
         client,
+        "name_retry",
         prompt=(
             "Generate one short polite sentence asking someone to repeat their name. "
             "Professional tone, not casual, max 12 words. Return only the sentence."
         ),
         fallback="I apologise, I didn't quite catch that. Could you please tell me your name?",
+        say=say,
     )
 
 
-def _generate_acknowledgement(client: Optional[Anthropic], name: str) -> str:
+def _generate_acknowledgement(client: Optional[Anthropic], name: str, say: bool = False) -> str:
     return _claude_text(
         client,
+        "acknowledgement",
         prompt=(
             f"Generate one short warm acknowledgement of someone's name: {name}. "
             "One sentence, professional, not over the top. "
@@ -83,12 +112,16 @@ def _generate_acknowledgement(client: Optional[Anthropic], name: str) -> str:
             "Return only the sentence."
         ),
         fallback=f"It's a pleasure to meet you, {name}.",
+        say=say,
     )
 
 
-def _generate_profession_question(client: Optional[Anthropic], display_name: str) -> str:
+def _generate_profession_question(
+    client: Optional[Anthropic], display_name: str, say: bool = False
+) -> str:
     return _claude_text(
         client,
+        "profession_question",
         prompt=(
             f"Generate one warm, simple question asking {display_name} what they do or what their background is. "
             "STRICT RULES: "
@@ -105,6 +138,7 @@ def _generate_profession_question(client: Optional[Anthropic], display_name: str
             "Return only the question, nothing else."
         ),
         fallback=f"{display_name}, I'd love to know about your background — what do you do?",
+        say=say,
     )
 
 
@@ -173,9 +207,10 @@ def _generate_years_question(
 
 # ── wake window ────────────────────────────────────────────────────────────────
 
-def _wake_window(starter: SamvadGenerator) -> Optional[str]:
+def _wake_window(starter: SamvadGenerator, start_cursor: Optional[int] = None) -> Optional[str]:
     """
-    Listen silently for 5 seconds.
+    Listen silently for 5 seconds (from `start_cursor` when given, so a
+    kiosk wake gate's pre-roll is included).
     Returns:
         None   -> nothing heard or noise/single word -> exit
         ""     -> real speech heard but no name found
@@ -187,6 +222,7 @@ def _wake_window(starter: SamvadGenerator) -> Optional[str]:
         silence_threshold=5,
         min_speech_duration=2.0,   # raised from 0.5 -- ignore short noise bursts
         max_recording_duration=5,
+        start_cursor=start_cursor,
     )
 
     if not text or not text.strip():
@@ -205,18 +241,22 @@ def _wake_window(starter: SamvadGenerator) -> Optional[str]:
 
 # ── main function ──────────────────────────────────────────────────────────────
 
-def get_user_info(client: Optional[Anthropic] = None) -> Optional[Dict[str, Any]]:
+def get_user_info(
+    client: Optional[Anthropic] = None, wake_cursor: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
     """
     Returns None if nothing heard in wake window.
     Returns structured user info dict otherwise.
+
+    wake_cursor: capture cursor the wake window starts from (kiosk mode).
     """
     print("\n  [RoboJEC] Starting — listening for activation…")
     starter = SamvadGenerator()
 
     # ── wake window ───────────────────────────────────────────────────────────
-    wake_result = _wake_window(starter)
+    wake_result = _wake_window(starter, wake_cursor)
     if wake_result is None:
-        print("  [Wake] Nothing heard. Exiting.")
+        print("  [Wake] Nothing heard.")
         return None
 
     name_from_intro = wake_result if wake_result != "" else None
@@ -226,12 +266,12 @@ def get_user_info(client: Optional[Anthropic] = None) -> Optional[Dict[str, Any]
     # ── name acquisition ──────────────────────────────────────────────────────
     if name_from_intro:
         name = name_from_intro
-        ack  = _generate_acknowledgement(client, name)
-        print(ack); speak(ack)
+        ack  = _generate_acknowledgement(client, name, say=True)
+        print(ack)
         time.sleep(0.5)
     else:
-        opening = _generate_opening(client)
-        print(opening); speak(opening)
+        opening = _generate_opening(client, say=True)
+        print(opening)
         time.sleep(0.5)
 
         name_text, _ = listen_and_save_name(None, "name_initial")
@@ -240,16 +280,16 @@ def get_user_info(client: Optional[Anthropic] = None) -> Optional[Dict[str, Any]
         for retry in range(3):
             if name and name != "Friend":
                 break
-            retry_q = _generate_name_retry(client)
-            print(retry_q); speak(retry_q)
+            retry_q = _generate_name_retry(client, say=True)
+            print(retry_q)
             name_text, _ = listen_and_save_name(None, f"name_retry_{retry}")
             name = starter.extract_name(name_text) if name_text else None
 
         if not name or name == "Friend":
             name = "Friend"
 
-        ack = _generate_acknowledgement(client, name)
-        print(ack); speak(ack)
+        ack = _generate_acknowledgement(client, name, say=True)
+        print(ack)
         time.sleep(0.5)
 
     # ── consent disclaimer ───────────────────────────────────────────────────
@@ -267,8 +307,8 @@ def get_user_info(client: Optional[Anthropic] = None) -> Optional[Dict[str, Any]
 
     # ── profession — first pass ───────────────────────────────────────────────
     # Use plain name for now; display_name set after we know title
-    prof_q = _generate_profession_question(client, name)
-    print(f"\n{prof_q}"); speak(prof_q)
+    prof_q = _generate_profession_question(client, name, say=True)
+    print(f"\n{prof_q}")
 
     prof_text, _ = listen_and_save_name(recording_dir, "profession_initial")
     profession_text = prof_text.strip() if prof_text else ""
@@ -0,0 +1,271 @@
+"""
+faster-whisper model registry and length-aware routing.
+
+Models are loaded on first use or at an explicit boot step (warm_up), never
+at import time. Loading also runs a short dummy decode so the CTranslate2
+warm-up cost is paid before the first guest speaks, not during their first
+answer. Load and warm-up times are kept per model.
+
+transcribe() routes short utterances (wake window, names, "repeat please")
+to ASR_SHORT_MODEL and everything else to ASR_LONG_MODEL, and keeps latency
+and real-time factor per route. transcribe_segments() decodes a long clip
+as pause-aligned segments on parallel workers of the same model and
+stitches the text back in order.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import (
+    ASR_COMPUTE_TYPE,
+    ASR_CPU_THREADS,
+    ASR_DEVICE,
+    ASR_LONG_MODEL,
+    ASR_PARALLEL_WORKERS,
+    ASR_SEGMENT_MAX_DURATION,
+    ASR_SEGMENT_MIN_DURATION,
+    ASR_SHORT_MAX_DURATION,
+    ASR_SHORT_MODEL,
+    WHISPER_LANGUAGE,
+    WHISPER_TARGET_SR,
+)
+
+ROUTE_SHORT = "short"
+ROUTE_LONG  = "long"
+_ROUTE_MODELS = {ROUTE_SHORT: ASR_SHORT_MODEL, ROUTE_LONG: ASR_LONG_MODEL}
+
+_MODELS: Dict[str, object]               = {}
+_LOAD_TIMES: Dict[str, Dict[str, float]] = {}
+_LOCKS: Dict[str, threading.Lock]        = {}
+_REGISTRY_LOCK                           = threading.Lock()
+
+_ROUTE_STATS: Dict[str, Dict[str, float]] = {}
+_STATS_LOCK                               = threading.Lock()
+
+
+# ── registry ───────────────────────────────────────────────────────────────────
+
+def _model_lock(name: str) -> threading.Lock:
+    with _REGISTRY_LOCK:
+        return _LOCKS.setdefault(name, threading.Lock())
+
+
+def get_model(name: str = ASR_LONG_MODEL):
+    """Return the named WhisperModel, loading and warming it on first use."""
+    model = _MODELS.get(name)
+    if model is not None:
+        return model
+    with _model_lock(name):
+        if name not in _MODELS:
+            _MODELS[name] = _load(name)
+        return _MODELS[name]
+
+
+def _load(name: str):
+    from faster_whisper import WhisperModel
+
+    t0    = time.time()
+    model = WhisperModel(
+        name,
+        device=ASR_DEVICE,
+        compute_type=ASR_COMPUTE_TYPE,
+        cpu_threads=ASR_CPU_THREADS,
+        num_workers=max(ASR_PARALLEL_WORKERS, 1),
+    )
+    load  = time.time() - t0
+
+    # one short decode initialises CTranslate2 kernels and caches
+    t1 = time.time()
+    dummy = np.random.default_rng(0).normal(0, 1e-3, WHISPER_TARGET_SR).astype(np.float32)
+    segments, _ = model.transcribe(dummy, language=WHISPER_LANGUAGE, beam_size=1)
+    for _ in segments:
+        pass
+    warm = time.time() - t1
+
+    _LOAD_TIMES[name] = {"load": load, "warm_up": warm}
+    print(f"  [ASR] Whisper '{name}' loaded in {load:.2f}s, warmed up in {warm:.2f}s")
+    return model
+
+
+def warm_up(
+    names: Optional[Iterable[str]] = None, background: bool = False
+) -> Optional[threading.Thread]:
+    """
+    Load and warm the given models (default: every routed model).
+
+    With background=True this returns the loader thread immediately so the
+    caller can carry on (e.g. open the mic and start the wake window).
+    """
+    names = list(names) if names is not None else list(dict.fromkeys(_ROUTE_MODELS.values()))
+
+    def _run() -> None:
+        for name in names:
+            try:
+                get_model(name)
+            except Exception as exc:
+                print(f"  [ASR] Failed to load '{name}': {exc}")
+
+    if not background:
+        _run()
+        return None
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+def load_times() -> Dict[str, Dict[str, float]]:
+    """{model: {"load": s, "warm_up": s}} for every model loaded so far."""
+    return {name: dict(t) for name, t in _LOAD_TIMES.items()}
+
+
+# ── routing ────────────────────────────────────────────────────────────────────
+
+def route_for(duration: float) -> str:
+    return ROUTE_SHORT if duration <= ASR_SHORT_MAX_DURATION else ROUTE_LONG
+
+
+def transcribe(
+    audio_np: np.ndarray,
+    initial_prompt: Optional[str] = None,
+    route: Optional[str] = None,
+) -> str:
+    """
+    Transcribe 16 kHz float32 audio on the model for its route.
+
+    `route` defaults to the length-based choice; pass ROUTE_LONG to keep
+    pieces of one long answer on the same model.
+    """
+    duration = len(audio_np) / WHISPER_TARGET_SR
+    route    = route or route_for(duration)
+    name     = _ROUTE_MODELS[route]
+    model    = get_model(name)
+
+    t0      = time.time()
+    text    = _decode(model, audio_np, initial_prompt)
+    latency = time.time() - t0
+
+    _record_route(route, name, duration, latency)
+    print(f"\n  [ASR] {route}/{name}: {duration:.1f}s audio in {latency:.2f}s "
+          f"(RTF {latency / max(duration, 1e-3):.2f})")
+    return text
+
+
+def _decode(model, audio_np: np.ndarray, initial_prompt: Optional[str] = None) -> str:
+    segments, _ = model.transcribe(
+        audio_np,
+        language=WHISPER_LANGUAGE,
+        beam_size=1,
+        vad_filter=True,
+        initial_prompt=initial_prompt,
+    )
+    return " ".join(seg.text for seg in segments).strip()
+
+
+# ── parallel segments ──────────────────────────────────────────────────────────
+
+def plan_segments(
+    n_samples: int,
+    pauses: Sequence[Tuple[int, int]],
+    sample_rate: int = WHISPER_TARGET_SR,
+    min_duration: float = ASR_SEGMENT_MIN_DURATION,
+    max_duration: float = ASR_SEGMENT_MAX_DURATION,
+) -> List[Tuple[int, int]]:
+    """
+    Split [0, n_samples) into (start, end) segments cut in the middle of
+    pauses. Each segment runs to the last pause that keeps it under
+    max_duration (but past min_duration); with no such pause it is cut
+    hard at max_duration. When only two segments are left, the cut goes
+    at the pause nearest the middle of the remainder, or at the middle
+    itself, so the last segment is never shorter than min_duration.
+    """
+    lo, hi = int(min_duration * sample_rate), int(max_duration * sample_rate)
+    mids   = sorted((a + b) // 2 for a, b in pauses)
+    out: List[Tuple[int, int]] = []
+    start  = 0
+    while n_samples - start > hi:
+        remaining = n_samples - start
+        usable    = [m for m in mids if start + lo <= m <= start + hi and n_samples - m >= lo]
+        if remaining < hi + lo:
+            middle = start + remaining // 2
+            cut    = min(usable, key=lambda m: abs(m - middle)) if usable else middle
+        else:
+            cut = usable[-1] if usable else start + hi
+        out.append((start, cut))
+        start = cut
+    out.append((start, n_samples))
+    return out
+
+
+def _decode_parallel(
+    model, audio_np: np.ndarray, segments: Sequence[Tuple[int, int]], workers: int
+) -> str:
+    # faster-whisper releases the GIL while decoding, so each thread occupies
+    # one of the model's num_workers replicas
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = [pool.submit(_decode, model, audio_np[s:e]) for s, e in segments]
+        texts   = [f.result() for f in futures]
+    return " ".join(t for t in texts if t).strip()
+
+
+def transcribe_segments(
+    audio_np: np.ndarray,
+    segments: Sequence[Tuple[int, int]],
+    route: str = ROUTE_LONG,
+) -> str:
+    """
+    Decode `segments` of 16 kHz float32 audio in parallel on the route's
+    model and return the texts joined in order.
+
+    Segments are independent (no initial_prompt chaining), which is what
+    lets them run concurrently.
+    """
+    if len(segments) <= 1 or ASR_PARALLEL_WORKERS <= 1:
+        return transcribe(audio_np, route=route)
+
+    duration = len(audio_np) / WHISPER_TARGET_SR
+    name     = _ROUTE_MODELS[route]
+    model    = get_model(name)
+
+    t0      = time.time()
+    text    = _decode_parallel(model, audio_np, segments, ASR_PARALLEL_WORKERS)
+    latency = time.time() - t0
+
+    _record_route(f"{route}_parallel", name, duration, latency)
+    print(f"\n  [ASR] {route}/{name}: {len(segments)} segments on {ASR_PARALLEL_WORKERS} workers, "
+          f"{duration:.1f}s audio in {latency:.2f}s (RTF {latency / max(duration, 1e-3):.2f})")
+    return text
+
+
+def _record_route(route: str, name: str, duration: float, latency: float) -> None:
+    with _STATS_LOCK:
+        stats = _ROUTE_STATS.setdefault(
+            route, {"model": name, "calls": 0, "audio": 0.0, "latency": 0.0}
+        )
+        stats["calls"]   += 1
+        stats["audio"]   += duration
+        stats["latency"] += latency
+
+
+def route_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Per-route totals: {route: {model, calls, audio, latency, avg_latency, rtf}}.
+    """
+    with _STATS_LOCK:
+        out = {}
+        for route, s in _ROUTE_STATS.items():
+            out[route] = {
+                **s,
+                "avg_latency": s["latency"] / max(s["calls"], 1),
+                "rtf":         s["latency"] / max(s["audio"], 1e-3),
+            }
+        return out
+
+
+def reset_route_stats() -> None:
+    """Start per-route totals afresh (e.g. for the next kiosk guest)."""
+    with _STATS_LOCK:
+        _ROUTE_STATS.clear()
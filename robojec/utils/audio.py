@@ -1,28 +1,52 @@
+import queue
+import struct
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import speech_recognition as sr
-from faster_whisper import WhisperModel
 
 from config import (
+    ASR_PARALLEL_MIN_DURATION,
+    ASR_TRIM_MARGIN,
+    GOOGLE_SR_ENDPOINT,
+    KIOSK_WAKE_MIN_SPEECH,
+    KIOSK_WAKE_PREROLL,
     MAX_RECORDING_DURATION,
-    MIC_DEVICE_INDEX,
     MIN_SPEECH_DURATION,
     NAME_MAX_DURATION,
     NAME_SILENCE_DURATION,
-    NOISE_ADJUST_DURATION,
+    NOISE_FLOOR_MARGIN,
+    NOISE_FLOOR_MIN_FRAMES,
+    NOISE_FLOOR_PERCENTILE,
+    NOISE_FLOOR_WINDOW,
     RECORDINGS_DIR,
     SILENCE_THRESHOLD_DURATION,
+    SHORT_UTTERANCE_ASR,
+    SHORT_UTTERANCE_PROMPT,
     SILENCE_THRESHOLD_ENERGY,
-    WHISPER_LANGUAGE,
+    STREAM_WINDOW_MAX_DURATION,
+    STREAM_WINDOW_MIN_DURATION,
+    STREAMING_ASR,
+    VAD_END_HANGOVER,
+    VAD_FALLING_RATIO,
+    VAD_MAX_HANGOVER,
+    VAD_MAX_SPEECH_ZCR,
+    VAD_MIN_PAUSE,
+    VAD_ONSET_FRAMES,
+    VAD_PAUSE_EXTENSION,
+    VAD_RECENT_PAUSES,
+    WHISPER_TARGET_SR,
     MAX_RETRIES_LISTEN,
 )
-from robojec.utils.tts import speak
-
-# ── faster-whisper (loaded once) ───────────────────────────────────────────────
-_WHISPER = WhisperModel("base", device="cpu", compute_type="int8")
+from robojec.utils import asr
+from robojec.utils.capture import CaptureService, get_capture_service
+from robojec.utils.frames import FrameStats, frame_stats, pcm_energy
+from robojec.utils.resample import resample
+from robojec.utils.tts import is_playing, speak
 
 # ── meta-request detection ─────────────────────────────────────────────────────
 # Phrases that mean the person wants the question repeated
@@ -116,173 +140,657 @@ def create_user_recording_directory(user_name: str) -> Path:
 
 # ── internal helpers ───────────────────────────────────────────────────────────
 
-def _pcm_energy(raw_data: bytes) -> float:
-    if not raw_data:
-        return 0.0
-    n = len(raw_data) // 2
-    return sum(
-        int.from_bytes(raw_data[i : i + 2], byteorder="little", signed=True) ** 2
-        for i in range(0, len(raw_data), 2)
-    ) / max(n, 1)
+class NoiseFloorTracker:
+    """
+    Rolling estimate of the background noise level.
+
+    Fed with every captured frame between turns, including idle gaps, but
+    not while TTS is playing (the robot's own voice leaking into the mic
+    would lift the floor and make the guest's first words miss the
+    threshold) and paused while an answer is recorded.
+    The speech threshold is the NOISE_FLOOR_PERCENTILE of recent frame
+    energies times NOISE_FLOOR_MARGIN, never below SILENCE_THRESHOLD_ENERGY.
+    """
 
+    def __init__(self, frame_duration: float) -> None:
+        self._energies: deque = deque(maxlen=max(int(NOISE_FLOOR_WINDOW / frame_duration), 1))
+        self._since_update    = 0
+        self._update_every    = max(int(0.5 / frame_duration), 1)
+        self._threshold       = float(SILENCE_THRESHOLD_ENERGY)
+        self.paused           = False
 
-def _record_frames(
-    source, recognizer, silence_threshold, min_speech_duration, max_duration
-):
-    frames          = []
-    frame_duration  = 0.1
-    start_time      = time.time()
-    last_sound_time = start_time
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    def update(self, raw: bytes) -> None:
+        if self.paused or is_playing():
+            return
+        self._energies.append(pcm_energy(raw))
+        self._since_update += 1
+        if self._since_update >= self._update_every:
+            self._since_update = 0
+            self._recompute()
+
+    def _recompute(self) -> None:
+        if len(self._energies) < NOISE_FLOOR_MIN_FRAMES:
+            return
+        floor = float(np.percentile(np.fromiter(self._energies, dtype=np.float64),
+                                    NOISE_FLOOR_PERCENTILE))
+        self._threshold = max(floor * NOISE_FLOOR_MARGIN, float(SILENCE_THRESHOLD_ENERGY))
+
+
+_NOISE_FLOOR: Optional[NoiseFloorTracker] = None
+
+
+def open_capture() -> CaptureService:
+    """Open (or reuse) the shared capture stream with the noise-floor tracker attached."""
+    global _NOISE_FLOOR
+    capture = get_capture_service()
+    if _NOISE_FLOOR is None:
+        _NOISE_FLOOR = NoiseFloorTracker(capture.frame_duration)
+    capture.add_frame_hook(_NOISE_FLOOR.update)
+    return capture
 
-    while True:
-        now             = time.time()
-        elapsed         = now - start_time
-        silence_elapsed = now - last_sound_time
 
+class _PcmBuffer:
+    """
+    Growable, preallocated int16 recording buffer.
+
+    The capture loop copies each frame straight into place; the WAV writer,
+    the ASR input and the willingness input are all views of it or of its
+    single float32 conversion.
+    """
+
+    def __init__(self, sample_rate: int, initial_seconds: float = 30.0) -> None:
+        self.sample_rate = sample_rate
+        self._data       = np.empty(max(int(sample_rate * initial_seconds), 1), dtype=np.int16)
+        self._n          = 0
+        self._float: Optional[np.ndarray] = None
+        # voiced extent as seen by the endpointer, in samples
+        self.first_voiced: Optional[int] = None
+        self.last_voiced_end             = 0
+        # (start, end) silent gaps between voiced runs, in samples
+        self.pauses: List[Tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def duration(self) -> float:
+        return self._n / self.sample_rate
+
+    def append(self, raw: bytes) -> None:
+        samples = np.frombuffer(raw, dtype="<i2", count=len(raw) // 2)
+        end     = self._n + samples.size
+        if end > self._data.size:
+            grown = np.empty(max(end, self._data.size * 2), dtype=np.int16)
+            grown[: self._n] = self._data[: self._n]
+            self._data = grown
+        self._data[self._n : end] = samples
+        self._n     = end
+        self._float = None
+
+    def mark_voiced(self, n_samples: int) -> None:
+        """Record that the last `n_samples` appended were voiced."""
+        start = self._n - n_samples
+        if self.first_voiced is None:
+            self.first_voiced = start
+        elif start - self.last_voiced_end >= VAD_MIN_PAUSE * self.sample_rate:
+            self.pauses.append((self.last_voiced_end, start))
+        self.last_voiced_end = self._n
+
+    def asr_span(self, margin: float = ASR_TRIM_MARGIN) -> Tuple[int, int]:
+        """
+        (start, end) sample range of the voiced part plus `margin` seconds
+        either side. Empty (0, 0) when nothing was voiced, so silence and
+        background noise are never sent to ASR.
+        """
+        if self.first_voiced is None:
+            return 0, 0
+        pad = int(margin * self.sample_rate)
+        return max(self.first_voiced - pad, 0), min(self.last_voiced_end + pad, self._n)
+
+    def pauses_in(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Pauses inside [start, end), relative to `start`."""
+        return [(a - start, b - start) for a, b in self.pauses if a >= start and b <= end]
+
+    def view(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """int16 view of the recorded samples (no copy)."""
+        end = self._n if end is None else min(end, self._n)
+        return self._data[start:end]
+
+    def to_float(self) -> np.ndarray:
+        """float32 in [-1, 1), converted once and shared by every consumer."""
+        if self._float is None or self._float.size != self._n:
+            self._float = _int16_to_float(self.view())
+        return self._float
+
+
+def _int16_to_float(samples: np.ndarray) -> np.ndarray:
+    out = np.empty(samples.size, dtype=np.float32)
+    np.multiply(samples, np.float32(1.0 / 32768.0), out=out, casting="unsafe")
+    return out
+
+
+class Endpointer:
+    """
+    Energy + ZCR voice-activity detector with an adaptive hangover.
+
+    States: waiting (no speech yet) → speech → hangover (silence after speech).
+    The turn closes once the hangover outlasts the allowed silence:
+
+      - VAD_END_HANGOVER after a clear sentence end (energy falling off),
+        or the speaker's mean recent pause + VAD_PAUSE_EXTENSION if longer
+      - + VAD_PAUSE_EXTENSION after an abrupt stop (likely mid-sentence)
+
+    never more than VAD_MAX_HANGOVER. `max_silence` (the old fixed silence
+    threshold) is how long we wait for the guest to start talking at all.
+    """
+
+    WAITING  = "waiting"
+    SPEECH   = "speech"
+    HANGOVER = "hangover"
+
+    def __init__(
+        self,
+        energy_threshold: float,
+        frame_duration: float,
+        min_speech_duration: float,
+        max_silence: float,
+        max_duration: float,
+    ) -> None:
+        self.energy_threshold    = energy_threshold
+        self.frame_duration      = frame_duration
+        self.min_speech_duration = min_speech_duration
+        self.max_silence         = max_silence
+        self.max_duration        = max_duration
+
+        self.state          = self.WAITING
+        self.elapsed        = 0.0
+        self.speech_time    = 0.0
+        self.pauses         = 0
+        self.done           = False
+        self.decision: Dict[str, Any] = {}
+
+        self._onset_run     = 0
+        self._silence_start = 0.0
+        self._last_voiced   = 0.0
+        self._allowed       = max_silence
+        self._falling       = False
+        self._energy_sum    = 0.0
+        self._energy_count  = 0
+        self._tail: deque   = deque(maxlen=max(int(0.15 / frame_duration), 1))
+        self._recent: deque = deque(maxlen=VAD_RECENT_PAUSES)
+
+    def _is_voiced(self, stats: FrameStats, n_samples: int) -> bool:
+        if stats.energy <= self.energy_threshold:
+            return False
+        # loud frames are speech regardless; quieter high-ZCR frames are hiss
+        return stats.zcr(n_samples) < VAD_MAX_SPEECH_ZCR or stats.energy > 3 * self.energy_threshold
+
+    def push(self, stats: FrameStats, n_samples: int, t: Optional[float] = None) -> bool:
+        """
+        Advance by one frame ending `t` seconds (sample clock) after the turn
+        started; defaults to one frame_duration after the previous frame.
+        Returns whether the frame was voiced.
+        """
+        self.elapsed = t if t is not None else self.elapsed + self.frame_duration
+        voiced = self._is_voiced(stats, n_samples)
+
+        if voiced:
+            self._onset_run += 1
+            self._energy_sum   += stats.energy
+            self._energy_count += 1
+            self._tail.append(stats.energy)
+        else:
+            self._onset_run = 0
+
+        if self.state == self.WAITING:
+            if self._onset_run >= VAD_ONSET_FRAMES:
+                self.state = self.SPEECH
+            elif self.elapsed >= self.max_silence and self.elapsed > self.min_speech_duration:
+                self._close("no_speech", self.elapsed)
+
+        elif self.state == self.SPEECH:
+            if voiced:
+                self.speech_time += self.frame_duration
+                self._last_voiced = self.elapsed
+            else:
+                self._enter_hangover()
+
+        elif self.state == self.HANGOVER:
+            silence = self.elapsed - self._silence_start
+            if voiced and self._onset_run >= VAD_ONSET_FRAMES:
+                if silence >= VAD_MIN_PAUSE:
+                    self.pauses += 1
+                    self._recent.append(silence)
+                self.state = self.SPEECH
+                self.speech_time += self.frame_duration
+                self._last_voiced = self.elapsed
+            elif silence >= self._allowed and self.elapsed > self.min_speech_duration:
+                self._close("end_of_turn", silence)
+
+        if not self.done and self.elapsed >= self.max_duration:
+            self._close("max_duration", self.elapsed - self._last_voiced)
+
+        return voiced
+
+    def _enter_hangover(self) -> None:
+        self.state          = self.HANGOVER
+        self._silence_start = self.elapsed
+        average = self._energy_sum / max(self._energy_count, 1)
+        tail    = sum(self._tail) / max(len(self._tail), 1)
+        self._falling = tail < VAD_FALLING_RATIO * average
+        allowed = VAD_END_HANGOVER
+        if self._recent:
+            allowed = max(allowed, sum(self._recent) / len(self._recent) + VAD_PAUSE_EXTENSION)
+        if not self._falling:
+            allowed += VAD_PAUSE_EXTENSION
+        self._allowed = min(allowed, VAD_MAX_HANGOVER, self.max_silence)
+
+    @property
+    def silence(self) -> float:
+        if self.state == self.HANGOVER:
+            return self.elapsed - self._silence_start
+        if self.state == self.WAITING:
+            return self.elapsed
+        return 0.0
+
+    @property
+    def speech_end(self) -> float:
+        """Seconds after turn start at which the last voiced frame ended."""
+        return self._last_voiced
+
+    def _close(self, reason: str, trailing_silence: float) -> None:
+        self.done     = True
+        self.decision = {
+            "reason":           reason,
+            "hangover":         round(self._allowed, 3),
+            "trailing_silence": round(trailing_silence, 3),
+            "falling":          self._falling,
+            "pauses":           self.pauses,
+            "speech_duration":  round(self.speech_time, 3),
+            "duration":         round(self.elapsed, 3),
+            "energy_threshold": round(self.energy_threshold, 1),
+        }
         print(
-            f"\r  [Rec] {elapsed:.1f}s | silence {silence_elapsed:.1f}s/{silence_threshold}s",
-            end="", flush=True,
+            f"\n  [VAD] {reason} after {trailing_silence:.2f}s silence "
+            f"(allowed {self._allowed:.2f}s, falling={self._falling}, "
+            f"pauses={self.pauses}, speech={self.speech_time:.1f}s)"
         )
 
-        if elapsed >= max_duration:
-            print("\n  [Rec] Max duration reached.")
-            break
-        if silence_elapsed >= silence_threshold and elapsed > min_speech_duration:
-            print("\n  [Rec] Silence threshold reached.")
-            break
 
+_LAST_ENDPOINT: Dict[str, Any] = {}
+
+
+def last_endpoint() -> Dict[str, Any]:
+    """End-of-turn decision of the most recent recording (empty if none)."""
+    return dict(_LAST_ENDPOINT)
+
+
+def _record_frames(
+    capture: CaptureService, silence_threshold, min_speech_duration, max_duration,
+    on_frame: Optional[Callable[["_PcmBuffer", bool], None]] = None,
+    wav_path: Optional[Path] = None,
+    cursor: Optional[int] = None,
+) -> _PcmBuffer:
+    pcm    = _PcmBuffer(capture.sample_rate)
+    cursor = capture.mark() if cursor is None else cursor
+    wav    = None
+    if wav_path is not None:
         try:
-            frame = recognizer.record(source, duration=frame_duration)
-            frames.append(frame)
-            if _pcm_energy(frame.get_raw_data()) > SILENCE_THRESHOLD_ENERGY:
-                last_sound_time = now
-        except sr.WaitTimeoutError:
-            continue
+            wav = _WavStreamWriter(wav_path, capture.sample_rate)
         except Exception as exc:
-            print(f"\n  [Rec] Frame error: {exc}")
-            time.sleep(0.2)
+            print(f"  [Audio] Save error: {exc}")
 
-    return frames
+    # adaptive threshold from the between-turn noise floor; frozen for this turn
+    energy_threshold = _NOISE_FLOOR.threshold if _NOISE_FLOOR else SILENCE_THRESHOLD_ENERGY
+    endpointer = Endpointer(
+        energy_threshold, capture.frame_duration,
+        min_speech_duration, silence_threshold, max_duration,
+    )
+    _LAST_ENDPOINT.clear()
+    if _NOISE_FLOOR:
+        _NOISE_FLOOR.paused = True
 
+    turn_start: Optional[float] = None
+    try:
+        while not endpointer.done:
+            chunk, cursor = capture.read(cursor, timeout=0.1)
+            for frame in chunk:
+                if turn_start is None:
+                    turn_start = frame.t
+                raw = frame.data
+                pcm.append(raw)
+                if wav is not None:
+                    wav.write(raw)
+                n_samples = len(raw) // capture.sample_width
+                t_end     = frame.t + n_samples / capture.sample_rate - turn_start
+                voiced    = endpointer.push(frame_stats(raw), n_samples, t_end)
+                if voiced:
+                    pcm.mark_voiced(n_samples)
+                if on_frame is not None:
+                    on_frame(pcm, voiced)
+                if endpointer.done:
+                    break
+
+            print(
+                f"\r  [Rec] {endpointer.elapsed:.1f}s | {endpointer.state} | "
+                f"silence {endpointer.silence:.1f}s",
+                end="", flush=True,
+            )
+    finally:
+        if _NOISE_FLOOR:
+            _NOISE_FLOOR.paused = False
+        if wav is not None:
+            try:
+                wav.close()
+            except Exception as exc:
+                print(f"  [Audio] Save error: {exc}")
+        _LAST_ENDPOINT.update(endpointer.decision)
+        if len(pcm):
+            start, end = pcm.asr_span()
+            _LAST_ENDPOINT["asr_trim"] = [
+                round(start / pcm.sample_rate, 3), round(end / pcm.sample_rate, 3),
+            ]
+        if turn_start is not None and endpointer.decision:
+            # wall-clock times from the sample clock, for timing_data.csv
+            _LAST_ENDPOINT["turn_start"] = capture.to_wall(turn_start)
+            _LAST_ENDPOINT["speech_end"] = capture.to_wall(turn_start + endpointer.speech_end)
+
+    return pcm
+
+
+class _WavStreamWriter:
+    """
+    Writes a 16-bit mono WAV file frame by frame while recording.
 
-def _frames_to_audio(frames, source):
-    if not frames:
-        return None
-    raw = b"".join(f.get_raw_data() for f in frames)
-    return sr.AudioData(raw, source.SAMPLE_RATE, source.SAMPLE_WIDTH) if raw else None
+    The RIFF/data sizes in the header are patched every _PATCH_INTERVAL
+    seconds and once more on close, so a crash mid-answer still leaves a
+    playable partial file. Files that end up with no audio are removed.
+    """
 
+    _PATCH_INTERVAL = 1.0
+
+    def __init__(self, path: Path, sample_rate: int) -> None:
+        self.path        = path
+        self.sample_rate = sample_rate
+        self._data_bytes = 0
+        self._unpatched  = 0
+        self._fh         = open(path, "wb")
+        self._fh.write(self._header(0))
+
+    def _header(self, data_bytes: int) -> bytes:
+        byte_rate = self.sample_rate * 2
+        return (
+            b"RIFF" + struct.pack("<I", 36 + data_bytes) + b"WAVE"
+            + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, self.sample_rate, byte_rate, 2, 16)
+            + b"data" + struct.pack("<I", data_bytes)
+        )
 
-def _save_wav(audio, path: Path) -> None:
-    try:
-        with open(path, "wb") as fh:
-            fh.write(audio.get_wav_data())
-    except Exception as exc:
-        print(f"  [Audio] Save error: {exc}")
+    def write(self, raw: bytes) -> None:
+        self._fh.write(raw)
+        self._data_bytes += len(raw)
+        self._unpatched  += len(raw)
+        if self._unpatched >= self._PATCH_INTERVAL * self.sample_rate * 2:
+            self._patch()
+
+    def _patch(self) -> None:
+        self._fh.seek(4)
+        self._fh.write(struct.pack("<I", 36 + self._data_bytes))
+        self._fh.seek(40)
+        self._fh.write(struct.pack("<I", self._data_bytes))
+        self._fh.seek(0, 2)
+        self._fh.flush()
+        self._unpatched = 0
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        self._patch()
+        self._fh.close()
+        if self._data_bytes == 0:
+            self.path.unlink(missing_ok=True)
+
+
+def _faster_whisper_transcribe(
+    audio_np: np.ndarray,
+    orig_sr: int,
+    initial_prompt: Optional[str] = None,
+    route: Optional[str] = None,
+) -> str:
+    if orig_sr != WHISPER_TARGET_SR:
+        audio_np = resample(audio_np, orig_sr, WHISPER_TARGET_SR)
+    return asr.transcribe(audio_np, initial_prompt=initial_prompt, route=route)
+
+
+def _transcribe_answer(pcm: _PcmBuffer, audio_np: np.ndarray, start: int, end: int) -> str:
+    """
+    Transcribe the trimmed span of a finished answer. Long answers are split
+    at the pauses the endpointer saw and decoded in parallel. Used only
+    when STREAMING_ASR is off; the streamer decodes windows as they close.
+    """
+    if (end - start) / pcm.sample_rate < ASR_PARALLEL_MIN_DURATION:
+        return _faster_whisper_transcribe(audio_np[start:end], pcm.sample_rate)
+    segments = asr.plan_segments(end - start, pcm.pauses_in(start, end), pcm.sample_rate)
+    return asr.transcribe_segments(audio_np[start:end], segments)
 
 
-def _faster_whisper_transcribe(audio_np: np.ndarray, orig_sr: int) -> str:
-    import librosa
-    if orig_sr != 16000:
-        try:
-            audio_np = librosa.resample(audio_np, orig_sr=orig_sr, target_sr=16000)
-        except Exception:
-            pass
-    segments, _ = _WHISPER.transcribe(
-        audio_np,
-        language=WHISPER_LANGUAGE,
-        beam_size=1,
-        vad_filter=True,
-    )
-    return " ".join(seg.text for seg in segments).strip()
+class _StreamingTranscriber:
+    """
+    Transcribes an answer window-by-window while it is still being recorded.
+
+    Windows are spans of the shared recording buffer. Once a window is at
+    least STREAM_WINDOW_MIN_DURATION long it is closed once the speaker has
+    been silent for VAD_MIN_PAUSE, the same gap the buffer records as a
+    pause (so words are not cut in half at a stop consonant), or forcibly at
+    STREAM_WINDOW_MAX_DURATION. Closed windows are decoded by a background
+    worker; when endpointing fires only the open tail still needs decoding.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        self.sample_rate   = sample_rate
+        self._pcm: Optional[_PcmBuffer] = None
+        self._window_start = 0
+        self._texts: List[str]    = []
+        self._error: Optional[Exception] = None
+        self._cancelled           = False
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def feed(self, pcm: _PcmBuffer, voiced: bool) -> None:
+        self._pcm = pcm
+        if pcm.first_voiced is None:
+            # nothing said yet: slide the window start along the lead-in silence
+            self._window_start = max(len(pcm) - int(ASR_TRIM_MARGIN * self.sample_rate), 0)
+            return
+        duration  = (len(pcm) - self._window_start) / self.sample_rate
+        silence   = (len(pcm) - pcm.last_voiced_end) / self.sample_rate
+        at_pause  = not voiced and silence >= VAD_MIN_PAUSE
+        if (duration >= STREAM_WINDOW_MIN_DURATION and at_pause) \
+                or duration >= STREAM_WINDOW_MAX_DURATION:
+            self._close_window()
+
+    def _close_window(self, end: Optional[int] = None) -> None:
+        if self._pcm is None:
+            return
+        end = len(self._pcm) if end is None else end
+        if end > self._window_start:
+            self._jobs.put((self._window_start, end))
+            self._window_start = end
+
+    def _run(self) -> None:
+        while True:
+            span = self._jobs.get()
+            if span is None:
+                return
+            if self._error is not None or self._cancelled:
+                continue
+            try:
+                start, end = span
+                audio_np   = _int16_to_float(self._pcm.view(start, end))
+                # previous text as prompt keeps wording consistent across windows
+                prompt = self._texts[-1] if self._texts else None
+                text   = _faster_whisper_transcribe(
+                    audio_np, self.sample_rate, prompt, route=asr.ROUTE_LONG,
+                )
+                if text:
+                    self._texts.append(text)
+                print(f"\n  [Stream] Window {len(self._texts)} decoded "
+                      f"({(end - start) / self.sample_rate:.1f}s)")
+            except Exception as exc:
+                self._error = exc
+
+    def finish(self, end: Optional[int] = None) -> str:
+        """
+        Decode the open tail (up to sample `end`, e.g. the trimmed voiced end),
+        wait for the worker and return the full text.
+        """
+        self._close_window(end)
+        self._jobs.put(None)
+        self._worker.join()
+        if self._error is not None:
+            raise self._error
+        return " ".join(self._texts).strip()
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        self._jobs.put(None)
 
 
 # ── public recording functions ─────────────────────────────────────────────────
 
+def wait_for_voice(
+    min_speech: float = KIOSK_WAKE_MIN_SPEECH,
+    preroll: float = KIOSK_WAKE_PREROLL,
+    stop: Optional[threading.Event] = None,
+) -> Optional[int]:
+    """
+    Block until someone starts talking. Energy/ZCR gate only, no ASR, so it
+    can run between guests indefinitely.
+
+    Returns a capture cursor `preroll` seconds before the voice onset, for
+    the wake window to record from; None if `stop` was set.
+    """
+    capture = open_capture()
+    cursor  = capture.mark()
+    need    = max(int(min_speech / capture.frame_duration), 1)
+    back    = int(preroll / capture.frame_duration)
+    run     = 0
+    while stop is None or not stop.is_set():
+        chunk, cursor = capture.read(cursor, timeout=0.5)
+        for frame in chunk:
+            threshold = _NOISE_FLOOR.threshold if _NOISE_FLOOR else SILENCE_THRESHOLD_ENERGY
+            stats     = frame_stats(frame.data)
+            n_samples = len(frame.data) // capture.sample_width
+            voiced    = stats.energy > threshold and (
+                stats.zcr(n_samples) < VAD_MAX_SPEECH_ZCR or stats.energy > 3 * threshold
+            )
+            run = run + 1 if voiced else 0
+            if run >= need:
+                return max(frame.seq - run + 1 - back, 0)
+    return None
+
+
 def listen_and_save(
     recording_dir: Path,
     question_id: str,
     silence_threshold: float = SILENCE_THRESHOLD_DURATION,
     min_speech_duration: float = MIN_SPEECH_DURATION,
     max_recording_duration: float = MAX_RECORDING_DURATION,
+    min_words: int = 3,
 ):
     """
-    Record and transcribe with faster-whisper.
+    Record and transcribe with faster-whisper. Answers shorter than
+    `min_words` are asked again (0 accepts any non-empty answer).
 
     Returns one of:
       (text, audio_np, processing_end_time)   — normal answer
       ("quit", audio_np, time)                — exit command
       (MetaRequest, audio_np, time)           — repeat/rephrase request
     """
-    recognizer = sr.Recognizer()
-
     for attempt in range(MAX_RETRIES_LISTEN):
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         print(f"  [Listen] Attempt {attempt + 1}/{MAX_RETRIES_LISTEN}")
 
         try:
-            time.sleep(0.3)
-            with sr.Microphone(device_index=MIC_DEVICE_INDEX) as source:
-                recognizer.adjust_for_ambient_noise(source, duration=NOISE_ADJUST_DURATION)
-                recognizer.dynamic_energy_threshold = False
-                recognizer.energy_threshold         = SILENCE_THRESHOLD_ENERGY
-
-                try:
-                    frames = _record_frames(
-                        source, recognizer,
-                        silence_threshold, min_speech_duration, max_recording_duration,
-                    )
-                except KeyboardInterrupt:
-                    return "quit", np.array([], dtype=np.float32), time.time()
-
-                audio = _frames_to_audio(frames, source)
-                if audio is None:
-                    print("  [Listen] No audio captured.")
-                    continue
-
-                if recording_dir:
-                    _save_wav(audio, recording_dir / f"{timestamp}_{question_id}_a{attempt+1}.wav")
-
-                audio_np = (
-                    np.frombuffer(audio.get_raw_data(), dtype=np.int16).astype(np.float32)
-                    / 32768.0
+            capture  = open_capture()
+            streamer = _StreamingTranscriber(capture.sample_rate) if STREAMING_ASR else None
+            try:
+                pcm = _record_frames(
+                    capture,
+                    silence_threshold, min_speech_duration, max_recording_duration,
+                    on_frame=streamer.feed if streamer else None,
+                    wav_path=(
+                        recording_dir / f"{timestamp}_{question_id}_a{attempt+1}.wav"
+                        if recording_dir else None
+                    ),
                 )
+            except KeyboardInterrupt:
+                if streamer:
+                    streamer.cancel()
+                return "quit", np.array([], dtype=np.float32), time.time()
+            except Exception:
+                if streamer:
+                    streamer.cancel()
+                raise
+
+            if not len(pcm):
+                if streamer:
+                    streamer.cancel()
+                print("  [Listen] No audio captured.")
+                continue
 
-                try:
-                    text           = _faster_whisper_transcribe(audio_np, source.SAMPLE_RATE)
-                    processing_end = time.time()
-                except Exception as exc:
-                    print(f"  [Whisper] Error: {exc}")
-                    if attempt < MAX_RETRIES_LISTEN - 1:
-                        speak("I'm having trouble understanding. Could you please try again?")
-                        continue
-                    return "", np.array([], dtype=np.float32), time.time()
-
-                print(f"  [You] {text}")
+            audio_np = pcm.to_float()
+            asr_start, asr_end = pcm.asr_span()
 
-                if not text:
-                    if attempt < MAX_RETRIES_LISTEN - 1:
-                        speak("I didn't quite catch that. Could you please say that again?")
-                        continue
-                    return "", np.array([], dtype=np.float32), processing_end
+            try:
+                if asr_end <= asr_start:
+                    # no speech detected: nothing worth decoding
+                    if streamer:
+                        streamer.cancel()
+                    print("  [Listen] No speech detected.")
+                    text = ""
+                elif streamer:
+                    text = streamer.finish(asr_end)
+                else:
+                    text = _transcribe_answer(pcm, audio_np, asr_start, asr_end)
+                processing_end = time.time()
+            except Exception as exc:
+                print(f"  [Whisper] Error: {exc}")
+                if attempt < MAX_RETRIES_LISTEN - 1:
+                    speak("I'm having trouble understanding. Could you please try again?")
+                    continue
+                return "", np.array([], dtype=np.float32), time.time()
 
-                # exit command
-                if text.lower().strip() in _EXIT_COMMANDS:
-                    return "quit", audio_np, processing_end
+            print(f"  [You] {text}")
 
-                # meta-request: check BEFORE word count gate
-                # short utterances like "I didn't understand" must be caught here
-                meta = detect_meta_request(text)
-                if meta:
-                    return meta, audio_np, processing_end
+            if not text:
+                if attempt < MAX_RETRIES_LISTEN - 1:
+                    speak("I didn't quite catch that. Could you please say that again?")
+                    continue
+                return "", np.array([], dtype=np.float32), processing_end
 
-                # only apply word count gate for genuine answers
-                if len(text.split()) < 3:
-                    if attempt < MAX_RETRIES_LISTEN - 1:
-                        speak("I didn't quite catch that. Could you please say that again?")
-                        continue
-                    return "", np.array([], dtype=np.float32), processing_end
+            # exit command
+            if text.lower().strip() in _EXIT_COMMANDS:
+                return "quit", audio_np, processing_end
+
+            # meta-request: check BEFORE word count gate
+            # short utterances like "I didn't understand" must be caught here
+            meta = detect_meta_request(text)
+            if meta:
+                return meta, audio_np, processing_end
+
+            # only apply word count gate for genuine answers
+            if len(text.split()) < min_words:
+                if attempt < MAX_RETRIES_LISTEN - 1:
+                    speak("I didn't quite catch that. Could you please say that again?")
+                    continue
+                return "", np.array([], dtype=np.float32), processing_end
 
-                return text, audio_np, processing_end
+            return text, audio_np, processing_end
 
         except Exception as exc:
             print(f"  [Listen] Outer error: {exc}")
@@ -294,6 +802,31 @@ def listen_and_save(
     return "", np.array([], dtype=np.float32), time.time()
 
 
+def _recognize_short(
+    pcm: _PcmBuffer, audio_np: np.ndarray, start: int, end: int
+) -> Optional[str]:
+    """Wake-window / quick-check recognition. None on failure."""
+    if SHORT_UTTERANCE_ASR == "google":
+        try:
+            audio = sr.AudioData(pcm.view(start, end).tobytes(), pcm.sample_rate, 2)
+            text  = sr.Recognizer().recognize_google(audio, endpoint=GOOGLE_SR_ENDPOINT)
+        except sr.UnknownValueError:
+            return None
+        except Exception as exc:
+            print(f"  [Google SR] Error: {exc}")
+            return None
+    else:
+        try:
+            text = _faster_whisper_transcribe(
+                audio_np[start:end], pcm.sample_rate, SHORT_UTTERANCE_PROMPT or None,
+            )
+        except Exception as exc:
+            print(f"  [Whisper] Error in short capture: {exc}")
+            return None
+    print(f"  [You] {text}")
+    return text
+
+
 def listen_and_save_name(
     recording_dir,
     question_id: str,
@@ -301,74 +834,67 @@ def listen_and_save_name(
     min_speech_duration: float = 1.0,
     max_recording_duration: float = NAME_MAX_DURATION,
     use_whisper: bool = False,
+    start_cursor: Optional[int] = None,
 ):
     """
     Short-window recording for name/profession collection.
 
-    use_whisper=False (default): Google SR — fast, good for wake window
-    use_whisper=True           : faster-whisper — more accurate, used for
+    use_whisper=False (default): short-utterance recognizer picked by
+                                 SHORT_UTTERANCE_ASR — local Whisper with a
+                                 vocabulary prompt, or Google SR
+    use_whisper=True           : faster-whisper without the prompt — used for
                                  name capture and profession collection where
                                  accuracy matters more than speed
 
+    start_cursor: capture cursor to record from (e.g. wait_for_voice's
+                  pre-roll) instead of "now".
+
     Returns (text, audio_np)
     """
-    recognizer = sr.Recognizer()
-
     try:
-        time.sleep(0.3)
-        with sr.Microphone(device_index=MIC_DEVICE_INDEX) as source:
-            recognizer.adjust_for_ambient_noise(source, duration=NOISE_ADJUST_DURATION)
-            recognizer.dynamic_energy_threshold = False
-            recognizer.energy_threshold         = SILENCE_THRESHOLD_ENERGY
+        capture   = open_capture()
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
 
-            try:
-                frames = _record_frames(
-                    source, recognizer,
-                    silence_threshold, min_speech_duration, max_recording_duration,
-                )
-            except KeyboardInterrupt:
-                return "quit", np.array([], dtype=np.float32)
+        try:
+            pcm = _record_frames(
+                capture,
+                silence_threshold, min_speech_duration, max_recording_duration,
+                wav_path=recording_dir / f"{timestamp}_{question_id}.wav" if recording_dir else None,
+                cursor=start_cursor,
+            )
+        except KeyboardInterrupt:
+            return "quit", np.array([], dtype=np.float32)
 
-            audio = _frames_to_audio(frames, source)
-            if audio is None:
-                return "", np.array([], dtype=np.float32)
+        if not len(pcm):
+            return "", np.array([], dtype=np.float32)
 
-            audio_np = (
-                np.frombuffer(audio.get_raw_data(), dtype=np.int16).astype(np.float32)
-                / 32768.0
-            )
+        audio_np = pcm.to_float()
+        asr_start, asr_end = pcm.asr_span()
+        if asr_end <= asr_start:
+            print("  [Listen] No speech detected.")
+            return "", audio_np
 
-            if recording_dir:
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                _save_wav(audio, recording_dir / f"{timestamp}_{question_id}.wav")
-
-            if use_whisper:
-                # Use faster-whisper for better accuracy
-                try:
-                    text = _faster_whisper_transcribe(audio_np, source.SAMPLE_RATE)
-                    print(f"  [You] {text}")
-                except Exception as exc:
-                    print(f"  [Whisper] Error in name capture: {exc}")
-                    return "", audio_np
-            else:
-                # Use Google SR for speed (wake window, quick checks)
-                try:
-                    text = recognizer.recognize_google(audio)
-                    print(f"  [You] {text}")
-                except sr.UnknownValueError:
-                    return "", audio_np
-                except Exception as exc:
-                    print(f"  [Google SR] Error: {exc}")
-                    return "", audio_np
-
-            if not text or not text.strip():
+        if use_whisper:
+            # Use faster-whisper for better accuracy
+            try:
+                text = _faster_whisper_transcribe(audio_np[asr_start:asr_end], capture.sample_rate)
+                print(f"  [You] {text}")
+            except Exception as exc:
+                print(f"  [Whisper] Error in name capture: {exc}")
+                return "", audio_np
+        else:
+            text = _recognize_short(pcm, audio_np, asr_start, asr_end)
+            if text is None:
                 return "", audio_np
 
-            if text.lower().strip() in _EXIT_COMMANDS:
-                return "quit", audio_np
+        if not text or not text.strip():
+            return "", audio_np
+
+        if text.lower().strip() in _EXIT_COMMANDS:
+            return "quit", audio_np
 
-            return text, audio_np
+        return text, audio_np
 
     except Exception as exc:
         print(f"  [listen_and_save_name] Error: {exc}")
-        return "", np.array([], dtype=np.float32)
\ No newline at end of file
+        return "", np.array([], dtype=np.float32)
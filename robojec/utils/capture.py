@@ -0,0 +1,242 @@
+"""
+Always-open microphone capture.
+
+The device is opened once per session with a PyAudio stream callback that
+pushes fixed-size frames into a ring buffer. Listen calls mark a start offset
+and consume frames from there, so no time is spent on device setup between
+turns and nothing is dropped between reads.
+
+Every frame carries a monotonic timestamp derived from the sample clock
+(samples captured so far / sample rate), not from when Python got around to
+reading it.
+
+Frames are always delivered at WHISPER_TARGET_SR. The device is opened at
+that rate when it supports it; otherwise it runs at SAMPLE_RATE and each
+frame is resampled in the callback.
+"""
+
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pyaudio
+
+from config import (
+    CAPTURE_BUFFER_SECONDS,
+    CHUNK_SIZE,
+    MIC_DEVICE_INDEX,
+    NATIVE_16K_CAPTURE,
+    SAMPLE_RATE,
+    WHISPER_TARGET_SR,
+)
+from robojec.utils.resample import StreamResampler
+
+
+class Frame(NamedTuple):
+    seq: int        # position in the stream, in frames
+    t: float        # time.monotonic() of the frame's first sample (sample clock)
+    data: bytes     # 16-bit mono little-endian PCM at WHISPER_TARGET_SR
+
+
+class CaptureService:
+    """
+    Long-lived capture stream backed by a lock-free ring buffer of frames.
+
+    The PortAudio callback is the only writer: it stores a Frame in slot
+    `seq % size` and then publishes it by bumping `_next_seq`. Readers keep
+    their own cursor (a sequence number) and copy out slots up to `_next_seq`,
+    checking each slot's seq to detect frames overwritten before they were read.
+    """
+
+    def __init__(
+        self,
+        device_index: Optional[int] = MIC_DEVICE_INDEX,
+        buffer_seconds: float = CAPTURE_BUFFER_SECONDS,
+    ) -> None:
+        self.device_index = device_index
+        self.device_rate  = SAMPLE_RATE          # rate the hardware runs at
+        self.sample_rate  = WHISPER_TARGET_SR    # rate of the frames we hand out
+        self.sample_width = 2
+        self.chunk_size   = CHUNK_SIZE           # device samples per callback
+
+        self.buffer_seconds = buffer_seconds
+        self._size = 1
+        self._ring: List[Optional[Frame]] = [None]
+        self._resampler: Optional[StreamResampler] = None
+        self._next_seq      = 0
+        self._samples       = 0
+        self._t0: Optional[float] = None
+        self._overflows     = 0
+        self._pa: Optional[pyaudio.PyAudio] = None
+        self._stream        = None
+        self._hooks: List[Callable[[bytes], None]] = []
+
+    # ── lifecycle ──────────────────────────────────────────────────────────────
+
+    @property
+    def frame_duration(self) -> float:
+        return self.chunk_size / self.device_rate
+
+    @property
+    def running(self) -> bool:
+        return self._stream is not None and self._stream.is_active()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.stop(quiet=True)
+        t0 = time.time()
+        self._pa          = pyaudio.PyAudio()
+        self._t0          = None
+        self._samples     = 0
+        self._next_seq    = 0
+        self.device_rate  = self._pick_device_rate()
+        self._resampler   = (
+            StreamResampler(self.device_rate, self.sample_rate)
+            if self.device_rate != self.sample_rate else None
+        )
+        self._size   = max(int(self.buffer_seconds / self.frame_duration), 1)
+        self._ring   = [None] * self._size
+        self._stream = self._pa.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=self.device_rate,
+            input=True,
+            input_device_index=self.device_index,
+            frames_per_buffer=self.chunk_size,
+            stream_callback=self._callback,
+        )
+        self._stream.start_stream()
+        mode = "native" if self._resampler is None else f"resampled from {self.device_rate} Hz"
+        print(f"  [Capture] Device {self.device_index} open "
+              f"({self.sample_rate} Hz {mode}, callback) in {time.time() - t0:.2f}s")
+
+    def _pick_device_rate(self) -> int:
+        if not NATIVE_16K_CAPTURE:
+            return SAMPLE_RATE
+        try:
+            self._pa.is_format_supported(
+                WHISPER_TARGET_SR,
+                input_device=self.device_index,
+                input_channels=1,
+                input_format=pyaudio.paInt16,
+            )
+            return WHISPER_TARGET_SR
+        except ValueError:
+            return SAMPLE_RATE
+
+    def stop(self, quiet: bool = False) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except Exception as exc:
+                print(f"  [Capture] Close error: {exc}")
+            self._stream = None
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
+            if not quiet:
+                print(f"  [Capture] Device closed ({self._overflows} input overflows).")
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        now = time.monotonic()
+        if self._t0 is None:
+            # anchor the sample clock: first sample of this buffer was
+            # captured one buffer-length before the callback fired
+            self._t0 = now - frame_count / self.device_rate
+        if status & pyaudio.paInputOverflow:
+            self._overflows += 1
+
+        data = in_data
+        if self._resampler is not None:
+            out  = self._resampler.process(np.frombuffer(in_data, dtype="<i2"))
+            data = np.clip(np.rint(out), -32768, 32767).astype("<i2").tobytes()
+
+        seq = self._next_seq
+        self._ring[seq % self._size] = Frame(
+            seq, self._t0 + self._samples / self.device_rate, data
+        )
+        self._samples  += frame_count
+        self._next_seq  = seq + 1          # publish after the slot is written
+
+        for hook in self._hooks:
+            try:
+                hook(data)
+            except Exception as exc:
+                print(f"\n  [Capture] Frame hook error: {exc}")
+        return None, pyaudio.paContinue
+
+    def add_frame_hook(self, hook: Callable[[bytes], None]) -> None:
+        """Call `hook(raw)` on the audio callback thread for every frame."""
+        if hook not in self._hooks:
+            self._hooks.append(hook)
+
+    # ── clocks ─────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def to_wall(t: float) -> float:
+        """Convert a sample-clock (monotonic) timestamp to time.time()."""
+        return time.time() - (time.monotonic() - t)
+
+    # ── reading ────────────────────────────────────────────────────────────────
+
+    def mark(self) -> int:
+        """Return a cursor pointing at the next frame to be captured."""
+        return self._next_seq
+
+    def read(self, cursor: int, timeout: float = 0.1) -> Tuple[List[Frame], int]:
+        """
+        Return (frames, new_cursor) for every frame captured since `cursor`.
+
+        Polls up to `timeout` seconds when nothing new is available.
+        Raises RuntimeError if the stream has stopped.
+        """
+        deadline = time.monotonic() + timeout
+        while self._next_seq <= cursor:
+            if not self.running:
+                raise RuntimeError("capture stream is not running")
+            if time.monotonic() >= deadline:
+                return [], cursor
+            time.sleep(self.frame_duration / 4)
+
+        end    = self._next_seq
+        oldest = max(end - self._size, 0)
+        if cursor < oldest:
+            print(f"\n  [Capture] Reader fell behind — dropped {oldest - cursor} frames")
+            cursor = oldest
+
+        frames = []
+        for seq in range(cursor, end):
+            frame = self._ring[seq % self._size]
+            if frame is None or frame.seq != seq:
+                # overwritten while we were copying; skip ahead
+                continue
+            frames.append(frame)
+        return frames, end
+
+
+# ── session-wide instance ──────────────────────────────────────────────────────
+
+_SERVICE: Optional[CaptureService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_capture_service() -> CaptureService:
+    """Return the shared capture service, opening the device on first use."""
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = CaptureService()
+        if not _SERVICE.running:
+            _SERVICE.start()
+        return _SERVICE
+
+
+def stop_capture_service() -> None:
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is not None:
+            _SERVICE.stop()
+            _SERVICE = None
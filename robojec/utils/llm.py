@@ -0,0 +1,458 @@
+"""
+Single gateway for every Claude call in the pipeline.
+
+Each call names its call site; the site's deadline (LLM_DEADLINES) bounds
+the whole call including retries. On top of that the gateway:
+
+  - caps requests in flight (LLM_MAX_CONCURRENCY)
+  - retries timeouts, 429 and 5xx with full-jitter exponential backoff
+  - trips a circuit breaker after LLM_BREAKER_FAILURES consecutive failures;
+    while open, calls raise LLMUnavailable immediately so call sites go
+    straight to their fallback strings, and one trial call is let through
+    every LLM_BREAKER_COOLDOWN seconds
+
+Failures are raised, not swallowed: call sites keep their own fallbacks.
+
+Conversational sites listed in LLM_HEDGE_BUDGETS are hedged on top of that
+(hedged_stream / hedged_complete): if the first token misses the budget the
+caller gets None and speaks its template, while the call runs on and its
+late reply is served instantly the next time the same prompt comes up.
+
+Sites listed in LLM_CACHE_TTLS are answered from a persistent reply cache
+(see llm_cache.py) when the same model and prompt were seen within the TTL;
+concurrent identical misses share one API call.
+"""
+
+import hashlib
+import queue
+import random
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+import anthropic
+
+from config import (
+    CLAUDE_MODEL,
+    LLM_BREAKER_COOLDOWN,
+    LLM_BREAKER_FAILURES,
+    LLM_CACHE_TTLS,
+    LLM_DEADLINES,
+    LLM_DEFAULT_DEADLINE,
+    LLM_HEDGE_BUDGETS,
+    LLM_LATE_REPLIES,
+    LLM_MAX_CONCURRENCY,
+    LLM_RETRIES,
+    LLM_RETRY_BASE_DELAY,
+)
+from robojec.utils.llm_cache import LlmCache
+
+T = TypeVar("T")
+
+
+class LLMUnavailable(Exception):
+    """Raised instead of calling Claude (breaker open, no slot or no time left)."""
+
+
+class _CircuitBreaker:
+
+    def __init__(self, failures: int, cooldown: float) -> None:
+        self.failures   = failures
+        self.cooldown   = cooldown
+        self._count     = 0
+        self._opened_at: Optional[float] = None
+        self._trial     = False
+        self._lock      = threading.Lock()
+
+    @property
+    def open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial and time.monotonic() - self._opened_at >= self.cooldown:
+                self._trial = True          # half-open: one call decides
+                return True
+            return False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._trial = False
+            if ok:
+                if self._opened_at is not None:
+                    print("  [LLM] API recovered — circuit closed")
+                self._count, self._opened_at = 0, None
+                return
+            self._count += 1
+            if self._count >= self.failures:
+                if self._opened_at is None:
+                    print(f"  [LLM] {self._count} failures in a row — circuit open, using fallbacks")
+                self._opened_at = time.monotonic()
+
+
+_BREAKER   = _CircuitBreaker(LLM_BREAKER_FAILURES, LLM_BREAKER_COOLDOWN)
+_SEMAPHORE = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+_late: "OrderedDict[str, str]" = OrderedDict()
+_site_stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {
+    "calls": 0, "templates": 0, "late_reused": 0,
+    "hits": 0, "misses": 0, "joined": 0, "saved": 0.0,
+})
+_stats_lock = threading.Lock()
+
+
+def _count(site: str, field: str, amount: float = 1) -> None:
+    with _stats_lock:
+        _site_stats[site][field] += amount
+
+
+def _status(exc: Exception) -> Optional[int]:
+    return getattr(exc, "status_code", None)
+
+
+def _retryable(exc: Exception) -> bool:
+    if isinstance(exc, (anthropic.APIConnectionError, anthropic.RateLimitError,
+                        anthropic.InternalServerError)):
+        return True
+    status = _status(exc)
+    return status is not None and (status in (408, 409, 429) or status >= 500)
+
+
+def _degraded(exc: Exception) -> bool:
+    """Failures that say the API is unusable right now (count for the breaker)."""
+    return _retryable(exc) or _status(exc) in (401, 403) or isinstance(exc, LLMUnavailable)
+
+
+def deadline_for(site: str) -> float:
+    return LLM_DEADLINES.get(site, LLM_DEFAULT_DEADLINE)
+
+
+def _call(
+    site: str,
+    attempt: Callable[[float], T],
+    deadline: Optional[float] = None,
+    hold: bool = False,
+) -> T:
+    """
+    Run `attempt(timeout)` under the site's deadline, retry policy and breaker.
+
+    With `hold`, a successful call keeps its concurrency slot and the caller
+    must release `_SEMAPHORE` when it is done with the result (a stream).
+    """
+    end = time.monotonic() + (deadline if deadline is not None else deadline_for(site))
+    _count(site, "calls")
+
+    if not _SEMAPHORE.acquire(timeout=max(end - time.monotonic(), 0.0)):
+        raise LLMUnavailable(f"{site}: no free slot before the deadline")
+    held = False
+    try:
+        if not _BREAKER.allow():
+            raise LLMUnavailable(f"{site}: circuit open")
+
+        error: Exception = LLMUnavailable(f"{site}: deadline exceeded")
+        for n in range(LLM_RETRIES + 1):
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                result = attempt(remaining)
+                _BREAKER.record(True)
+                held = hold
+                return result
+            except Exception as exc:
+                error = exc
+                if not _retryable(exc):
+                    break
+                delay = random.uniform(0, LLM_RETRY_BASE_DELAY * 2 ** n)
+                if n == LLM_RETRIES or time.monotonic() + delay >= end:
+                    break
+                time.sleep(delay)
+
+        _BREAKER.record(not _degraded(error))
+        print(f"  [LLM] {site} failed: {error}")
+        raise error
+    finally:
+        if not held:
+            _SEMAPHORE.release()
+
+
+def complete(
+    client: Any,
+    site: str,
+    prompt: str,
+    max_tokens: int = 80,
+    model: str = CLAUDE_MODEL,
+    deadline: Optional[float] = None,
+) -> str:
+    """Text of a single-turn reply. Raises on failure."""
+    def attempt(timeout: float) -> str:
+        resp = client.with_options(max_retries=0, timeout=timeout).messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return resp.content[0].text
+
+    return _cached(site, model, max_tokens, prompt, lambda: _call(site, attempt, deadline))
+
+
+def stream_text(
+    client: Any,
+    site: str,
+    prompt: str,
+    max_tokens: int = 80,
+    model: str = CLAUDE_MODEL,
+) -> Iterator[str]:
+    """
+    Yield the text of a single-turn reply as it streams in.
+
+    The site's deadline and retries cover opening the stream up to the
+    first text delta; after that deltas are passed through as they arrive.
+    The concurrency slot is held until the stream is exhausted or closed.
+    """
+    def attempt(timeout: float):
+        manager = client.with_options(max_retries=0, timeout=timeout).messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        stream = manager.__enter__()
+        try:
+            deltas = iter(stream.text_stream)
+            first  = next(deltas, "")
+        except BaseException:
+            manager.__exit__(*sys.exc_info())
+            raise
+        return manager, first, deltas
+
+    manager, first, deltas = _call(site, attempt, hold=True)
+    try:
+        if first:
+            yield first
+        yield from deltas
+    finally:
+        try:
+            manager.__exit__(None, None, None)
+        finally:
+            _SEMAPHORE.release()
+
+
+# ── reply cache ───────────────────────────────────────────────────────────────
+
+_CACHE: Optional[LlmCache] = None
+_CACHE_LOCK = threading.Lock()
+
+_IN_FLIGHT: Dict[str, Future] = {}
+_FLIGHT_LOCK = threading.Lock()
+
+
+def _cache() -> LlmCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = LlmCache()
+        return _CACHE
+
+
+def _cache_lookup(site: str, key: str) -> Optional[str]:
+    """Cached reply for a cached site (counting the hit or miss), else None."""
+    start = time.monotonic()
+    try:
+        hit = _cache().get(key, LLM_CACHE_TTLS[site])
+    except sqlite3.Error as exc:
+        print(f"  [LLM] cache lookup failed: {exc}")
+        hit = None
+    if hit is None:
+        _count(site, "misses")
+        return None
+    text, latency = hit
+    _count(site, "hits")
+    _count(site, "saved", max(latency - (time.monotonic() - start), 0.0))
+    return text
+
+
+def _cache_store(site: str, key: str, text: str, latency: float) -> None:
+    try:
+        _cache().put(key, site, text, latency)
+    except sqlite3.Error as exc:
+        print(f"  [LLM] cache write failed: {exc}")
+
+
+def _cached(site: str, model: str, max_tokens: int, prompt: str, call: Callable[[], str]) -> str:
+    """
+    Serve `call()` from the reply cache for cached sites. Concurrent misses
+    on the same prompt wait for the first one instead of calling again.
+    """
+    if site not in LLM_CACHE_TTLS:
+        return call()
+    key  = LlmCache.key(model, max_tokens, prompt)
+    text = _cache_lookup(site, key)
+    if text is not None:
+        return text
+
+    with _FLIGHT_LOCK:
+        future = _IN_FLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _IN_FLIGHT[key] = Future()
+    if not leader:
+        _count(site, "joined")
+        return future.result(timeout=deadline_for(site))
+
+    start = time.monotonic()
+    try:
+        text = call()
+        _cache_store(site, key, text, time.monotonic() - start)
+        future.set_result(text)
+        return text
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _FLIGHT_LOCK:
+            _IN_FLIGHT.pop(key, None)
+
+
+# ── hedging ───────────────────────────────────────────────────────────────────
+
+def hedge_budget(site: str) -> Optional[float]:
+    return LLM_HEDGE_BUDGETS.get(site)
+
+
+def _prompt_key(site: str, model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{site}\0{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _keep_late(key: str, text: str) -> None:
+    with _stats_lock:
+        _late[key] = text
+        _late.move_to_end(key)
+        while len(_late) > LLM_LATE_REPLIES:
+            _late.popitem(last=False)
+
+
+def _pop_late(key: str) -> Optional[str]:
+    with _stats_lock:
+        return _late.pop(key, None)
+
+
+def _drain(first: str, deltas: "queue.Queue") -> Iterator[str]:
+    yield first
+    while True:
+        item = deltas.get()
+        if item is None:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def hedged_stream(
+    client: Any,
+    site: str,
+    prompt: str,
+    max_tokens: int = 80,
+    model: str = CLAUDE_MODEL,
+    budget: Optional[float] = None,
+) -> Optional[Iterator[str]]:
+    """
+    Deltas of the reply if the first one arrives within the site's hedge
+    budget, else None (use the template). Unhedged sites just stream.
+    """
+    budget = hedge_budget(site) if budget is None else budget
+    if budget is None:
+        return stream_text(client, site, prompt, max_tokens, model)
+
+    cache_key = LlmCache.key(model, max_tokens, prompt) if site in LLM_CACHE_TTLS else None
+    if cache_key is not None:
+        cached = _cache_lookup(site, cache_key)
+        if cached is not None:
+            return iter([cached])
+
+    key  = _prompt_key(site, model, prompt)
+    late = _pop_late(key)
+    if late:
+        _count(site, "late_reused")
+        print(f"  [LLM] {site}: using the late reply from last time")
+        return iter([late])
+
+    deltas    = queue.Queue()
+    abandoned = threading.Event()
+    start     = time.monotonic()
+
+    def pump() -> None:
+        parts = []
+        try:
+            for delta in stream_text(client, site, prompt, max_tokens, model):
+                parts.append(delta)
+                deltas.put(delta)
+        except Exception as exc:
+            deltas.put(exc)
+            return
+        deltas.put(None)
+        text = "".join(parts)
+        if text and cache_key is not None:
+            _cache_store(site, cache_key, text, time.monotonic() - start)
+        elif text and abandoned.is_set():
+            _keep_late(key, text)
+            print(f"  [LLM] {site}: late reply kept for next time")
+
+    threading.Thread(target=pump, daemon=True, name=f"llm-{site}").start()
+    try:
+        first = deltas.get(timeout=budget)
+    except queue.Empty:
+        abandoned.set()
+        _count(site, "templates")
+        print(f"  [LLM] {site}: no reply within {budget * 1000:.0f} ms — using template")
+        return None
+    if isinstance(first, Exception):
+        raise first
+    if first is None:
+        return iter(())
+    return _drain(first, deltas)
+
+
+def hedged_complete(
+    client: Any,
+    site: str,
+    prompt: str,
+    max_tokens: int = 80,
+    model: str = CLAUDE_MODEL,
+    budget: Optional[float] = None,
+) -> Optional[str]:
+    """complete() under the site's hedge budget; None means use the template."""
+    if (hedge_budget(site) if budget is None else budget) is None:
+        return complete(client, site, prompt, max_tokens, model)
+    deltas = hedged_stream(client, site, prompt, max_tokens, model, budget)
+    return None if deltas is None else "".join(deltas)
+
+
+# ── stats ─────────────────────────────────────────────────────────────────────
+
+def circuit_open() -> bool:
+    return _BREAKER.open
+
+
+def site_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Per call site: API calls, templates spoken on a missed budget, late
+    replies reused, and for cached sites hits / misses / joined in-flight
+    calls, hit ratio and the API time the hits saved.
+    """
+    with _stats_lock:
+        stats = {site: dict(s) for site, s in _site_stats.items()}
+    for s in stats.values():
+        lookups = s["hits"] + s["misses"]
+        s["hit_ratio"] = s["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def reset_site_stats() -> None:
+    with _stats_lock:
+        _site_stats.clear()
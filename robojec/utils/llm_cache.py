@@ -0,0 +1,78 @@
+"""
+Persistent cache of Claude replies.
+
+Replies are stored in a SQLite file (LLM_CACHE_PATH) keyed by
+sha256(model, max_tokens, prompt), together with the call site and the
+latency of the call that produced them, so a hit can report the time it
+saved. Entries older than the caller's TTL are dropped on lookup; past
+LLM_CACHE_MAX_ENTRIES the least recently used ones are deleted.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from config import LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS replies (
+    key      TEXT PRIMARY KEY,
+    site     TEXT NOT NULL,
+    text     TEXT NOT NULL,
+    latency  REAL NOT NULL,
+    created  REAL NOT NULL,
+    used     REAL NOT NULL
+)
+"""
+
+
+class LlmCache:
+    """Size-bounded LRU table of replies, safe to share between threads."""
+
+    def __init__(self, path: Path = Path(LLM_CACHE_PATH), max_entries: int = LLM_CACHE_MAX_ENTRIES) -> None:
+        self.path        = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db   = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.execute("CREATE INDEX IF NOT EXISTS replies_used ON replies (used)")
+
+    @staticmethod
+    def key(model: str, max_tokens: int, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{max_tokens}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[Tuple[str, float]]:
+        """(text, original latency) if cached and younger than `ttl`, else None."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT text, latency, created FROM replies WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            text, latency, created = row
+            if now - created > ttl:
+                self._db.execute("DELETE FROM replies WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE replies SET used = ? WHERE key = ?", (now, key))
+        return text, latency
+
+    def put(self, key: str, site: str, text: str, latency: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO replies VALUES (?, ?, ?, ?, ?, ?)",
+                (key, site, text, latency, now, now),
+            )
+            (count,) = self._db.execute("SELECT COUNT(*) FROM replies").fetchone()
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM replies WHERE key IN "
+                    "(SELECT key FROM replies ORDER BY used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
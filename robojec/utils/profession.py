@@ -16,6 +16,8 @@ import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
+from robojec.utils.llm import complete
+
 try:
     import spacy
     _nlp = spacy.load("en_core_web_sm")
@@ -120,14 +122,9 @@ Keep it brief, friendly, and genuinely helpful. Return only the sentence."""
 
 # ── Claude helpers ─────────────────────────────────────────────────────────────
 
-def _claude_call(client: Any, prompt: str, max_tokens: int = 400) -> Optional[str]:
+def _claude_call(client: Any, site: str, prompt: str, max_tokens: int = 400) -> Optional[str]:
     try:
-        resp = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        return resp.content[0].text.strip()
+        return complete(client, site, prompt, max_tokens).strip()
     except Exception as exc:
         print(f"  [Claude] Call failed: {exc}")
         return None
@@ -139,6 +136,7 @@ def generate_specialisation_examples(client: Any, profession: str) -> str:
         return ""
     result = _claude_call(
         client,
+        "examples",
         _EXAMPLES_PROMPT.format(profession=profession),
         max_tokens=80,
     )
@@ -220,7 +218,7 @@ def recognize_profession_claude(
     years_experience: Optional[float] = None,
 ) -> Dict[str, Any]:
     cleaned = _clean_profession_text(profession_text)
-    raw = _claude_call(client, _PROFESSION_PROMPT.format(text=cleaned))
+    raw = _claude_call(client, "profession", _PROFESSION_PROMPT.format(text=cleaned))
     if raw is None:
         return recognize_profession_fallback(profession_text, years_experience)
 
@@ -0,0 +1,77 @@
+"""
+Rational polyphase resampler in NumPy.
+
+Used to bring microphone audio down to WHISPER_TARGET_SR when the device
+cannot capture at that rate natively. It runs incrementally, one capture
+frame at a time, carrying the filter history across calls, so the whole
+answer is never resampled in one go after recording.
+"""
+
+from math import gcd
+
+import numpy as np
+
+
+class StreamResampler:
+    """
+    Resample a stream by L/M with a windowed-sinc anti-aliasing filter.
+
+    The prototype low-pass is split into L phases of `taps_per_phase` taps.
+    Each output sample is one dot product between a phase and the most recent
+    input samples, computed for a whole frame at once.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, taps_per_phase: int = 16) -> None:
+        g            = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.up      = out_rate // g
+        self.down    = in_rate // g
+        self.taps    = taps_per_phase
+
+        # low-pass at 90% of the lower Nyquist, on the up-sampled rate grid
+        n      = self.up * taps_per_phase
+        cutoff = 0.9 * 0.5 / max(self.up, self.down)
+        t      = np.arange(n) - (n - 1) / 2
+        proto  = 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(n, 8.0) * self.up
+        # phases[p, k] = proto[k * up + p]
+        self._phases = proto.reshape(taps_per_phase, self.up).T.astype(np.float32)
+
+        self._history = np.zeros(taps_per_phase - 1, dtype=np.float32)
+        self._consumed = 0          # input samples consumed before the current call
+        self._next_out = 0          # index of the next output sample
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Feed input samples (int16 or float) and return float32 output samples."""
+        x   = np.asarray(samples, dtype=np.float32)
+        buf = np.concatenate((self._history, x))
+        end = self._consumed + x.size                  # first input index not yet available
+
+        # outputs whose newest input sample is already available
+        last_out = (end * self.up - 1) // self.down
+        if last_out < self._next_out:
+            self._advance(buf, x.size)
+            return np.empty(0, dtype=np.float32)
+
+        out_idx = np.arange(self._next_out, last_out + 1, dtype=np.int64)
+        pos     = out_idx * self.down
+        in_idx  = pos // self.up - self._consumed + (self.taps - 1)   # index into buf
+        phase   = pos % self.up
+
+        window = buf[in_idx[:, None] - np.arange(self.taps)[None, :]]
+        out    = np.einsum("nk,nk->n", self._phases[phase], window)
+
+        self._next_out = last_out + 1
+        self._advance(buf, x.size)
+        return out
+
+    def _advance(self, buf: np.ndarray, n_in: int) -> None:
+        self._history  = buf[buf.size - (self.taps - 1):].copy()
+        self._consumed += n_in
+
+
+def resample(samples: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+    """One-shot resample of a whole clip (float32 output)."""
+    if in_rate == out_rate:
+        return np.asarray(samples, dtype=np.float32)
+    return StreamResampler(in_rate, out_rate).process(samples)
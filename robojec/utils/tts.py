@@ -1,17 +1,414 @@
+import itertools
+import queue
+import re
+import threading
 import time
+import wave
+from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import pyaudio
 import pyttsx3
 
-from config import TTS_RATE
+from config import TTS_RATE, TTS_VOICE
+from robojec.utils.tts_cache import TtsCache, link_or_copy
 
+_PLAYBACK_CHUNK = 1024
+_SENTENCE_END   = re.compile(r"(?<=[.!?])\s+")
+# a period after these (or after an initial like "J." / "U.S.") doesn't end a sentence
+_ABBREVIATIONS  = {"mr", "mrs", "ms", "dr", "prof", "st", "sr", "jr", "vs", "etc", "e.g", "i.e"}
+_INITIALS       = re.compile(r"(?:[A-Za-z]\.)*[A-Z]")
 
-def speak(text: str, rate: int = TTS_RATE) -> None:
-    """Speak text aloud. Blocks until speech is complete."""
-    engine = pyttsx3.init()
+
+# ── resident engine ────────────────────────────────────────────────────────────
+
+class _TtsWorker:
+    """
+    One long-lived thread that owns the only pyttsx3 engine.
+
+    pyttsx3.init() is paid once; speak/render jobs are queued and each
+    returns a Future that completes when the engine has finished it. Jobs
+    run lowest priority first (foreground 0, prefetch 1), FIFO within one.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: "queue.PriorityQueue[tuple]" = queue.PriorityQueue()
+        self._seq    = itertools.count()
+        self._ready  = threading.Event()
+        self._voice  = TTS_VOICE
+        self._thread = threading.Thread(target=self._run, name="tts-worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def voice(self) -> str:
+        """Voice id the engine speaks with (waits for the engine to start)."""
+        self._ready.wait()
+        return self._voice
+
+    def submit(self, fn: Callable[..., Any], *args: Any, priority: int = 0) -> Future:
+        """Run `fn(engine, *args)` on the worker thread."""
+        future: Future = Future()
+        self._jobs.put((priority, next(self._seq), future, fn, args))
+        return future
+
+    def _run(self) -> None:
+        t0 = time.time()
+        try:
+            engine = pyttsx3.init()
+            if TTS_VOICE:
+                engine.setProperty("voice", TTS_VOICE)
+            self._voice = str(engine.getProperty("voice"))
+            print(f"  [TTS] Engine ready in {time.time() - t0:.2f}s")
+        except Exception as exc:
+            engine, init_error = None, exc
+            print(f"  [TTS] Engine init failed: {exc}")
+        finally:
+            self._ready.set()
+        while True:
+            _, _, future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if engine is None:
+                future.set_exception(init_error)
+                continue
+            try:
+                future.set_result(fn(engine, *args))
+            except Exception as exc:
+                future.set_exception(exc)
+
+
+_WORKER: Optional[_TtsWorker] = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _worker() -> _TtsWorker:
+    global _WORKER
+    with _WORKER_LOCK:
+        if _WORKER is None:
+            _WORKER = _TtsWorker()
+        return _WORKER
+
+
+def start_tts() -> None:
+    """Start the engine thread now so the first utterance doesn't pay for it."""
+    _worker()
+
+
+def _say(engine, text: str, rate: int) -> None:
     engine.setProperty("rate", rate)
     engine.say(text)
+    with _playing():
+        engine.runAndWait()
+
+
+def _render(engine, text: str, path: Path, rate: int) -> Path:
+    engine.setProperty("rate", rate)
+    engine.save_to_file(text, str(path))
     engine.runAndWait()
+    return path
+
+
+def speak_async(text: str, rate: int = TTS_RATE) -> Future:
+    """Queue text to be spoken; the Future completes when speech has ended."""
+    return _worker().submit(_say, text, rate)
+
+
+def render_async(text: str, path: Path, rate: int = TTS_RATE) -> Future:
+    """Queue text to be rendered to `path` without playing it."""
+    return _worker().submit(_render, text, path, rate)
+
+
+# ── rendered-clip cache ────────────────────────────────────────────────────────
+
+_CACHE: Optional[TtsCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache() -> TtsCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = TtsCache()
+        return _CACHE
+
+
+_IN_FLIGHT: Dict[str, Tuple[Future, int]] = {}
+_RENDER_SECONDS: Dict[str, float]          = {}
+_PREFETCHED: set                           = set()
+_FLIGHT_LOCK = threading.RLock()
+_LAST_RENDER: Dict[str, Any] = {}
+
+
+def _render_into_cache(engine, cache: TtsCache, key: str, text: str, rate: int) -> Path:
+    t0  = time.time()
+    tmp = cache.tmp_path(key)
+    _render(engine, text, tmp, rate)
+    if not tmp.exists():
+        raise RuntimeError("engine produced no audio file")
+    path = cache.add(key, tmp)
+    _RENDER_SECONDS[key] = time.time() - t0
+    return path
+
+
+def _render_future(key: str, text: str, rate: int, priority: int) -> Future:
+    """
+    Future of the cached clip for `key`. Joins a render already in flight;
+    a foreground request for a clip still queued as a prefetch re-queues it
+    at foreground priority.
+    """
+    cache = _cache()
+    path  = cache.get(key)
+    if path is not None:
+        done: Future = Future()
+        done.set_result(path)
+        return done
+
+    with _FLIGHT_LOCK:
+        entry = _IN_FLIGHT.get(key)
+        if entry is not None:
+            future, queued_at = entry
+            if queued_at <= priority or not future.cancel():
+                return future
+        future = _worker().submit(_render_into_cache, cache, key, text, rate, priority=priority)
+        _IN_FLIGHT[key] = (future, priority)
+
+    def _forget(done: Future) -> None:
+        with _FLIGHT_LOCK:
+            if _IN_FLIGHT.get(key, (None,))[0] is done:
+                del _IN_FLIGHT[key]
+
+    future.add_done_callback(_forget)
+    return future
+
+
+def _key(text: str, rate: int) -> str:
+    return _cache().key(text, rate, _worker().voice)
+
+
+def render_cached(text: str, rate: int = TTS_RATE) -> Path:
+    """
+    Path of the cached clip for (text, rate, voice), rendering it on a miss.
+    Raises if the engine produced no file.
+
+    Records where the clip came from for last_render().
+    """
+    key = _key(text, rate)
+    with _FLIGHT_LOCK:
+        prefetched = key in _PREFETCHED
+        pending    = key in _IN_FLIGHT
+        _PREFETCHED.discard(key)
+    cached = _cache().get(key) is not None
+
+    t0     = time.time()
+    path   = _render_future(key, text, rate, priority=0).result()
+    waited = time.time() - t0
+
+    _LAST_RENDER.clear()
+    _LAST_RENDER.update({
+        "source": (
+            "prefetch" if prefetched and (pending or cached)
+            else "cache" if cached
+            else "render"
+        ),
+        "waited": waited,
+        "saved":  max(_RENDER_SECONDS.get(key, waited) - waited, 0.0),
+    })
+    return path
+
+
+def prefetch(text: str, rate: int = TTS_RATE) -> None:
+    """
+    Render `text` into the cache in the background, behind foreground speech.
+
+    Only the latest prefetch counts as one in last_render(): a candidate
+    that was never spoken stops being tracked when the next turn prefetches,
+    and a clip that was already cached is a plain cache hit.
+    """
+    try:
+        key = _key(text, rate)
+        with _FLIGHT_LOCK:
+            _PREFETCHED.clear()
+            if _cache().get(key) is None:
+                _PREFETCHED.add(key)
+        _render_future(key, text, rate, priority=1)
+    except Exception as exc:
+        print(f"  [TTS] Prefetch error: {exc}")
+
+
+def last_render() -> Dict[str, Any]:
+    """
+    How the most recent render_cached() was served:
+    {"source": "prefetch" | "cache" | "render", "waited": s, "saved": s}.
+    """
+    return dict(_LAST_RENDER)
+
+
+# ── playback ───────────────────────────────────────────────────────────────────
+
+_PA: Optional[pyaudio.PyAudio] = None
+_PA_LOCK = threading.Lock()
+
+_PLAYING      = 0
+_PLAYING_LOCK = threading.Lock()
+
+
+@contextmanager
+def _playing() -> Iterator[None]:
+    global _PLAYING
+    with _PLAYING_LOCK:
+        _PLAYING += 1
+    try:
+        yield
+    finally:
+        with _PLAYING_LOCK:
+            _PLAYING -= 1
+
+
+def is_playing() -> bool:
+    """True while a clip or live speech is coming out of the speaker."""
+    return _PLAYING > 0
+
+
+def _pyaudio() -> pyaudio.PyAudio:
+    global _PA
+    with _PA_LOCK:
+        if _PA is None:
+            _PA = pyaudio.PyAudio()
+        return _PA
+
+
+def play_wav(path: Path) -> float:
+    """
+    Play a WAV file on the default output device. Blocks until done.
+
+    Returns the time.time() at which the first audio buffer was handed to
+    the device.
+    """
+    pa = _pyaudio()
+    with wave.open(str(path), "rb") as wf, _playing():
+        stream = pa.open(
+            format=pa.get_format_from_width(wf.getsampwidth()),
+            channels=wf.getnchannels(),
+            rate=wf.getframerate(),
+            output=True,
+        )
+        try:
+            first_byte_time = None
+            data = wf.readframes(_PLAYBACK_CHUNK)
+            while data:
+                if first_byte_time is None:
+                    first_byte_time = time.time()
+                stream.write(data)
+                data = wf.readframes(_PLAYBACK_CHUNK)
+        finally:
+            stream.stop_stream()
+            stream.close()
+    return first_byte_time if first_byte_time is not None else time.time()
+
+
+def _is_abbreviation(text: str) -> bool:
+    """True if `text` ends in a period that belongs to an abbreviation."""
+    if not text.endswith("."):
+        return False
+    words = text[:-1].split()
+    word  = words[-1].lstrip("(\"'") if words else ""
+    return word.lower() in _ABBREVIATIONS or bool(_INITIALS.fullmatch(word))
+
+
+def _split_raw(text: str) -> List[str]:
+    """Split at sentence ends, keeping "Dr. Mishra" and "e.g. this" together."""
+    parts, start = [], 0
+    for match in _SENTENCE_END.finditer(text):
+        if not _is_abbreviation(text[start:match.start()]):
+            parts.append(text[start:match.start()])
+            start = match.end()
+    parts.append(text[start:])
+    return parts
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _split_raw(text.strip()) if s.strip()]
+
+
+def speak(text: str, rate: int = TTS_RATE) -> None:
+    """
+    Speak text aloud. Blocks until speech is complete.
+
+    Every sentence is queued for rendering up front and played as soon as
+    its clip is ready, so sentence N+1 renders while N plays and the first
+    sound waits only for the first sentence.
+    """
+    sentences = split_sentences(text)
+    futures   = [_render_future(_key(s, rate), s, rate, priority=0) for s in sentences]
+    for i, future in enumerate(futures):
+        try:
+            play_wav(future.result())
+        except Exception as exc:
+            print(f"  [TTS] Pipelined playback failed ({exc}); speaking the rest live")
+            speak_async(" ".join(sentences[i:]), rate).result()
+            return
+
+
+def speak_stream(
+    chunks: Iterable[str],
+    rate: int = TTS_RATE,
+    on_sentence: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Speak text while it is still arriving (e.g. LLM token deltas).
+
+    Each sentence is queued for rendering the moment its boundary arrives
+    and played in order on a player thread, so speech starts while the
+    rest is still being generated. If the source fails part-way, the
+    sentences already complete are still spoken and an unfinished
+    fragment is dropped. `on_sentence` is called with the text queued so
+    far each time a sentence is queued, before it plays.
+
+    Returns the text that was spoken.
+    """
+    playlist: "queue.Queue[Optional[Tuple[str, Future]]]" = queue.Queue()
+    player = threading.Thread(target=_play_in_order, args=(playlist, rate), daemon=True)
+    player.start()
+
+    spoken: List[str] = []
+    buffer = ""
+
+    def _queue(sentence: str) -> None:
+        sentence = sentence.strip()
+        if sentence:
+            spoken.append(sentence)
+            playlist.put((sentence, _render_future(_key(sentence, rate), sentence, rate, priority=0)))
+            if on_sentence is not None:
+                on_sentence(" ".join(spoken))
+
+    try:
+        for chunk in chunks:
+            buffer += chunk
+            *complete, buffer = _split_raw(buffer)
+            for sentence in complete:
+                _queue(sentence)
+        _queue(buffer)
+    except Exception as exc:
+        print(f"  [TTS] Text stream failed: {exc}")
+    finally:
+        playlist.put(None)
+        player.join()
+    return " ".join(spoken)
+
+
+def _play_in_order(playlist: "queue.Queue[Optional[Tuple[str, Future]]]", rate: int) -> None:
+    while True:
+        item = playlist.get()
+        if item is None:
+            return
+        sentence, future = item
+        try:
+            play_wav(future.result())
+        except Exception as exc:
+            print(f"  [TTS] Playback failed ({exc}); speaking live")
+            _speak_live(sentence, rate)
 
 
 def speak_and_record(
@@ -21,47 +418,46 @@ def speak_and_record(
     rate: int = TTS_RATE,
 ) -> tuple[Path | None, float]:
     """
-    Speak text aloud and simultaneously save it to a WAV file.
+    Render text to a WAV file once, then play that file.
+
+    Renders come from the shared clip cache, so a question asked before (by
+    any guest) is hardlinked into recording_dir instead of re-synthesized.
+    The WAV that is saved is exactly what the guest heard. If the file
+    can't be played (e.g. nsss writes AIFF, or no output device), the text
+    is spoken live instead.
 
     Returns
     -------
     (audio_file_path, first_byte_timestamp)
         audio_file_path   : Path to the saved WAV, or None on failure
-        first_byte_timestamp : time.time() value when speech began
+        first_byte_timestamp : time.time() value when playback began
     """
-    tts_start      = time.time()
-    first_byte_time: float | None = None
-    first_byte_flag = [False]          # mutable container for nonlocal write in callback
-
-    def on_start(name: str) -> None:
-        if not first_byte_flag[0]:
-            first_byte_flag[0] = True
-            nonlocal first_byte_time          # type: ignore[misc]
-            first_byte_time = time.time()
-            print(f"  [TTS] first byte after {first_byte_time - tts_start:.3f}s")
+    tts_start = time.time()
+    wav_path  = recording_dir / f"{recording_id}_question.wav"
 
     try:
-        engine = pyttsx3.init()
-        engine.setProperty("rate", rate)
-        engine.connect("started-utterance", on_start)
+        link_or_copy(render_cached(text, rate), wav_path)
+    except Exception as exc:
+        print(f"  [TTS] Error in speak_and_record: {exc}; speaking live")
+        return None, _speak_live(text, rate)
 
-        wav_path = recording_dir / f"{recording_id}_question.wav"
-        engine.save_to_file(text, str(wav_path))
-        engine.say(text)
-        engine.runAndWait()
+    try:
+        first_byte_time = play_wav(wav_path)
+    except Exception as exc:
+        print(f"  [TTS] Can't play rendered file ({exc}); speaking live")
+        first_byte_time = _speak_live(text, rate)
 
-        if first_byte_time is None:
-            first_byte_time = time.time()
+    print(f"  [TTS] first byte after {first_byte_time - tts_start:.3f}s")
+    return wav_path, first_byte_time
 
-        if wav_path.exists():
-            return wav_path, first_byte_time
-        else:
-            print(f"  [TTS] Warning: WAV not created at {wav_path}")
-            return None, first_byte_time
 
+def _speak_live(text: str, rate: int) -> float:
+    first_byte_time = time.time()
+    try:
+        speak_async(text, rate).result()
     except Exception as exc:
-        print(f"  [TTS] Error in speak_and_record: {exc}")
-        return None, time.time()
+        print(f"  [TTS] Error speaking: {exc}")
+    return first_byte_time
 
 
 def record_system_speech(
@@ -77,16 +473,9 @@ def record_system_speech(
     """
     try:
         wav_path = recording_dir / f"{recording_id}_question.wav"
-        engine = pyttsx3.init()
-        engine.setProperty("rate", rate)
-        engine.save_to_file(text, str(wav_path))
-        engine.runAndWait()
-
-        if wav_path.exists():
-            return wav_path
-        print(f"  [TTS] Warning: WAV not created at {wav_path}")
-        return None
+        link_or_copy(render_cached(text, rate), wav_path)
+        return wav_path
 
     except Exception as exc:
         print(f"  [TTS] Error in record_system_speech: {exc}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,87 @@
+"""
+Content-addressed disk cache of rendered TTS audio.
+
+Clips are stored as <sha256(text, rate, voice)>.wav under TTS_CACHE_DIR.
+A hit refreshes the file's mtime; when the directory grows past
+TTS_CACHE_MAX_BYTES the least recently used clips are deleted.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+from config import TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES
+
+
+class TtsCache:
+    """Size-bounded LRU directory of rendered clips, safe to share between threads."""
+
+    def __init__(self, root: Path = Path(TTS_CACHE_DIR), max_bytes: int = TTS_CACHE_MAX_BYTES) -> None:
+        self.root      = Path(root)
+        self.max_bytes = max_bytes
+        self._tmp      = self.root / "tmp"
+        self._tmp.mkdir(parents=True, exist_ok=True)
+        self._lock  = threading.Lock()
+        self._total = sum(p.stat().st_size for p in self.root.glob("*.wav"))
+
+    @staticmethod
+    def key(text: str, rate: int, voice: str) -> str:
+        return hashlib.sha256(f"{voice}\0{rate}\0{text}".encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.root / f"{key}.wav"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Cached clip for `key`, or None. Marks it as recently used."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def tmp_path(self, key: str) -> Path:
+        """Where to render a clip before add()ing it."""
+        return self._tmp / f"{key}.{threading.get_ident()}.wav"
+
+    def add(self, key: str, rendered: Path) -> Path:
+        """Move a freshly rendered file into the cache and evict if needed."""
+        path = self.path(key)
+        size = rendered.stat().st_size
+        with self._lock:
+            if path.exists():
+                self._total -= path.stat().st_size
+            os.replace(rendered, path)
+            self._total += size
+            if self._total > self.max_bytes:
+                self._evict(keep=path)
+        return path
+
+    def _evict(self, keep: Path) -> None:
+        clips = sorted(self.root.glob("*.wav"), key=lambda p: p.stat().st_mtime)
+        for clip in clips:
+            if self._total <= self.max_bytes:
+                break
+            if clip == keep:
+                continue
+            try:
+                size = clip.stat().st_size
+                clip.unlink()
+                self._total -= size
+            except OSError:
+                pass
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink `src` to `dst` (copy across filesystems), replacing `dst`."""
+    try:
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
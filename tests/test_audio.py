@@ -0,0 +1,109 @@
+import numpy as np
+
+import robojec.utils.audio as audio
+import robojec.utils.tts as tts
+from config import NOISE_FLOOR_MIN_FRAMES, STREAM_WINDOW_MIN_DURATION, VAD_MIN_PAUSE
+
+RATE     = 16000
+FRAME_MS = 64
+FRAME    = RATE * FRAME_MS // 1000
+
+
+def _feed(streamer, pcm, seconds, voiced):
+    for _ in range(int(round(seconds * 1000 / FRAME_MS))):
+        pcm.append(np.full(FRAME, 3000 if voiced else 0, dtype=np.int16).tobytes())
+        if voiced:
+            pcm.mark_voiced(FRAME)
+        streamer.feed(pcm, voiced)
+
+
+def _streamer(monkeypatch):
+    windows = []
+
+    def fake_transcribe(audio_np, sample_rate, prompt, route=None):
+        windows.append(len(audio_np) / sample_rate)
+        return f"window {len(windows)}"
+
+    monkeypatch.setattr(audio, "_faster_whisper_transcribe", fake_transcribe)
+    return audio._StreamingTranscriber(RATE), audio._PcmBuffer(RATE), windows
+
+
+def test_short_gap_does_not_close_a_long_window(monkeypatch):
+    streamer, pcm, windows = _streamer(monkeypatch)
+    _feed(streamer, pcm, STREAM_WINDOW_MIN_DURATION + 0.5, voiced=True)
+    _feed(streamer, pcm, 0.07, voiced=False)      # a stop consonant, not a pause
+    _feed(streamer, pcm, 1.0, voiced=True)
+
+    assert streamer.finish() == "window 1"
+    assert len(windows) == 1
+
+
+def test_real_pause_closes_a_long_window(monkeypatch):
+    streamer, pcm, windows = _streamer(monkeypatch)
+    _feed(streamer, pcm, STREAM_WINDOW_MIN_DURATION + 0.5, voiced=True)
+    _feed(streamer, pcm, VAD_MIN_PAUSE + 0.1, voiced=False)
+    _feed(streamer, pcm, 1.0, voiced=True)
+
+    assert streamer.finish() == "window 1 window 2"
+    assert windows[0] >= STREAM_WINDOW_MIN_DURATION + 0.5 + VAD_MIN_PAUSE
+
+
+def test_noise_floor_ignores_frames_captured_during_playback():
+    tracker = audio.NoiseFloorTracker(FRAME_MS / 1000)
+    quiet   = np.full(FRAME, 40, dtype=np.int16).tobytes()
+    loud    = np.full(FRAME, 3000, dtype=np.int16).tobytes()
+    for _ in range(NOISE_FLOOR_MIN_FRAMES):
+        tracker.update(quiet)
+    before = tracker.threshold
+
+    with tts._playing():
+        for _ in range(NOISE_FLOOR_MIN_FRAMES * 4):
+            tracker.update(loud)
+    assert tracker.threshold == before
+
+    for _ in range(NOISE_FLOOR_MIN_FRAMES * 4):
+        tracker.update(loud)
+    assert tracker.threshold > before
+
+
+def test_silent_recording_is_not_sent_to_asr(monkeypatch):
+    pcm = audio._PcmBuffer(RATE)
+    pcm.append(np.zeros(RATE * 2, dtype=np.int16).tobytes())
+    assert pcm.asr_span() == (0, 0)
+
+    def fail_transcribe(*args, **kwargs):
+        raise AssertionError("ASR ran on a recording with no speech")
+
+    monkeypatch.setattr(audio, "open_capture", lambda: type("Capture", (), {"sample_rate": RATE})())
+    monkeypatch.setattr(audio, "_record_frames", lambda *args, **kwargs: pcm)
+    monkeypatch.setattr(audio, "_faster_whisper_transcribe", fail_transcribe)
+    monkeypatch.setattr(audio, "speak", lambda *args, **kwargs: None)
+
+    text, audio_np, _ = audio.listen_and_save(None, "q1")
+    assert text == ""
+    assert audio_np.size == 0
+
+
+def test_long_answer_is_decoded_in_parallel_at_its_pauses(monkeypatch):
+    decoded = {}
+
+    def fake_decode(model, audio_np, segments, workers):
+        decoded["segments"] = list(segments)
+        return " ".join(f"part {i + 1}" for i in range(len(segments)))
+
+    monkeypatch.setattr(audio.asr, "get_model", lambda name: object())
+    monkeypatch.setattr(audio.asr, "_decode_parallel", fake_decode)
+    monkeypatch.setattr(audio, "_faster_whisper_transcribe", lambda *a, **k: "single pass")
+
+    pcm = audio._PcmBuffer(RATE)
+    for seconds, voiced in [(15.0, True), (0.5, False), (12.0, True), (0.5, False), (12.0, True)]:
+        pcm.append(np.zeros(int(seconds * RATE), dtype=np.int16).tobytes())
+        if voiced:
+            pcm.mark_voiced(int(seconds * RATE))
+    start, end = pcm.asr_span()
+
+    text = audio._transcribe_answer(pcm, pcm.to_float(), start, end)
+
+    assert text == "part 1 part 2"
+    cut = decoded["segments"][0][1] + start
+    assert any(a <= cut <= b for a, b in pcm.pauses)
@@ -0,0 +1,84 @@
+import csv
+import time
+
+import numpy as np
+
+import robojec.pipeline.interview_runner as runner
+from config import HOBBY_QUESTION_COUNT, PROFESSIONAL_QUESTION_COUNT
+from robojec.core.interview_system import PersonalityInterviewSystem
+from robojec.core.willingness_analyzer import WillingnessLevel
+
+LEVELS = [level.value for level in WillingnessLevel]
+
+
+def _write_dataset(questions_dir, category_type, category, n=30):
+    path = questions_dir / f"{category_type}_{category.lower().replace(' ', '_')}_questions.csv"
+    with open(path, "w", newline="") as fh:
+        writer = csv.DictWriter(
+            fh, fieldnames=["question", "category_type", "category", "willingness_level"]
+        )
+        writer.writeheader()
+        for i in range(n):
+            writer.writerow({
+                "question":          f"What is memorable about {category} number {i}?",
+                "category_type":     category_type,
+                "category":          category,
+                "willingness_level": LEVELS[i % len(LEVELS)],
+            })
+
+
+def test_phase_loop_prefetches_the_question_asked_next(tmp_path, monkeypatch):
+    questions_dir = tmp_path / "questions"
+    questions_dir.mkdir()
+    _write_dataset(questions_dir, "main", "Engineering")
+    _write_dataset(questions_dir, "subcategory", "Software Engineer")
+    _write_dataset(questions_dir, "hobby", "chess")
+    _write_dataset(questions_dir, "hobby", "cooking")
+
+    system = PersonalityInterviewSystem(
+        client=None, questions_dir=questions_dir,
+        main_category="Engineering", subcategory="Software Engineer",
+    )
+    # every answer moves willingness, so a reservation keyed by level would miss
+    levels = iter(list(WillingnessLevel) * 10)
+    monkeypatch.setattr(system, "update_willingness_level", lambda audio: (next(levels), 50.0))
+
+    asked, prefetched = [], []
+
+    def fake_speak_and_record(text, recording_dir, recording_id, rate=None):
+        if recording_id.endswith(("_prof_question", "_hobby_question")):
+            asked.append(text)
+        return None, time.time()
+
+    def fake_listen(question_text, recording_dir, question_id, client, **kwargs):
+        return "I have enjoyed every part of it", np.zeros(1600, dtype=np.float32), time.time()
+
+    def fake_dataset_job(qgen, category_type, category_name, system, ready_event=None, session_id=None):
+        if ready_event:
+            ready_event.set()
+
+    monkeypatch.setattr(runner, "RESPONSES_DIR", str(tmp_path / "responses"))
+    monkeypatch.setattr(runner, "speak", lambda text, rate=None: None)
+    monkeypatch.setattr(runner, "speak_and_record", fake_speak_and_record)
+    monkeypatch.setattr(runner, "prefetch", lambda text, rate=None: prefetched.append(text))
+    monkeypatch.setattr(runner, "last_render", lambda: {})
+    monkeypatch.setattr(runner, "last_endpoint", lambda: {})
+    monkeypatch.setattr(runner, "save_response", lambda *args, **kwargs: None)
+    monkeypatch.setattr(runner, "ask_feedback_question", lambda *args, **kwargs: None)
+    monkeypatch.setattr(runner, "_listen_with_meta_handling", fake_listen)
+    monkeypatch.setattr(runner, "_maybe_followup",
+                        lambda system, answer, qc, rd, last_end, *rest: (answer, last_end, False))
+    monkeypatch.setattr(runner, "_generate_hobby_intro",
+                        lambda *args, **kwargs: ("Lovely.", ["chess", "cooking", "chess"]))
+    monkeypatch.setattr(runner, "generate_dataset_background", fake_dataset_job)
+    monkeypatch.setattr(runner.time, "sleep", lambda seconds: None)
+
+    runner.conduct_interview(system, "Test Guest", tmp_path / "recordings")
+
+    assert len(asked) == PROFESSIONAL_QUESTION_COUNT + HOBBY_QUESTION_COUNT
+    assert len(prefetched) == (PROFESSIONAL_QUESTION_COUNT - 1) + (HOBBY_QUESTION_COUNT - 1)
+
+    prof, hobby = asked[:PROFESSIONAL_QUESTION_COUNT], asked[PROFESSIONAL_QUESTION_COUNT:]
+    assert prefetched[:PROFESSIONAL_QUESTION_COUNT - 1] == prof[1:]
+    assert prefetched[PROFESSIONAL_QUESTION_COUNT - 1:] == hobby[1:]
+    assert "cooking" in hobby[1]
@@ -0,0 +1,51 @@
+import robojec.utils.llm as llm
+from config import LLM_MAX_CONCURRENCY
+
+
+class _FakeStream:
+    def __init__(self, deltas):
+        self.text_stream = iter(deltas)
+        self.closed      = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+class _FakeClient:
+    def __init__(self, deltas):
+        self.messages = self
+        self.opened   = _FakeStream(deltas)
+
+    def with_options(self, **kwargs):
+        return self
+
+    def stream(self, **kwargs):
+        return self.opened
+
+
+def _free_slots():
+    return llm._SEMAPHORE._value
+
+
+def test_stream_holds_its_slot_until_exhausted():
+    client = _FakeClient(["Hello", " there", "."])
+    deltas = llm.stream_text(client, "welcome", "Say hello")
+
+    assert next(deltas) == "Hello"
+    assert _free_slots() == LLM_MAX_CONCURRENCY - 1
+    assert list(deltas) == [" there", "."]
+    assert _free_slots() == LLM_MAX_CONCURRENCY
+    assert client.opened.closed
+
+
+def test_stream_releases_its_slot_when_closed_early():
+    client = _FakeClient(["Hello", " there", "."])
+    deltas = llm.stream_text(client, "welcome", "Say hello")
+
+    next(deltas)
+    deltas.close()
+    assert _free_slots() == LLM_MAX_CONCURRENCY
+    assert client.opened.closed
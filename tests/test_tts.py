@@ -0,0 +1,28 @@
+import robojec.utils.tts as tts
+
+
+def test_split_sentences_keeps_abbreviations_with_their_sentence():
+    text = "Welcome, Dr. Agya Mishra. Tell me about St. Louis, e.g. the food! Mr. J. R. Smith said so?"
+    assert tts.split_sentences(text) == [
+        "Welcome, Dr. Agya Mishra.",
+        "Tell me about St. Louis, e.g. the food!",
+        "Mr. J. R. Smith said so?",
+    ]
+
+
+def test_split_sentences_still_splits_ordinary_sentences():
+    assert tts.split_sentences("I see. That sounds fun.  What next?") == [
+        "I see.", "That sounds fun.", "What next?",
+    ]
+
+
+def test_speak_stream_does_not_break_after_a_title(monkeypatch):
+    queued = []
+    monkeypatch.setattr(tts, "_render_future", lambda key, text, rate, priority: None)
+    monkeypatch.setattr(tts, "_play_in_order", lambda playlist, rate: None)
+
+    chunks = ["Thank you, Dr", ". Agya", " Mishra. It was", " a pleasure."]
+    spoken = tts.speak_stream(chunks, on_sentence=queued.append)
+
+    assert spoken == "Thank you, Dr. Agya Mishra. It was a pleasure."
+    assert queued == ["Thank you, Dr. Agya Mishra.", spoken]
@@ -0,0 +1,107 @@
+"""
+Benchmark: real-time factor of parallel segmented transcription vs cores.
+
+Decodes one long clip sequentially and then as pause-aligned segments on
+1, 2, 4, ... parallel workers, for each thread split of the available
+cores, and prints wall time and RTF. Needs a real speech recording; a
+short one can be tiled to minutes with --repeat.
+
+    python tools/bench_asr_parallel.py answer.wav [--repeat 4] [--model base]
+                                       [--workers 1 2 4 8] [--cores 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import (                                   # noqa: E402
+    ASR_COMPUTE_TYPE,
+    ASR_DEVICE,
+    ASR_LONG_MODEL,
+    VAD_MIN_PAUSE,
+    WHISPER_TARGET_SR,
+)
+from robojec.utils.asr import _decode, _decode_parallel, plan_segments  # noqa: E402
+from robojec.utils.frames import pcm_energy            # noqa: E402
+from robojec.utils.resample import resample            # noqa: E402
+
+
+def _load_wav(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            sys.exit("expected 16-bit PCM")
+        raw = wf.readframes(wf.getnframes())
+        pcm = np.frombuffer(raw, dtype="<i2").reshape(-1, wf.getnchannels())[:, 0]
+        rate = wf.getframerate()
+    audio = pcm.astype(np.float32) / 32768.0
+    if rate != WHISPER_TARGET_SR:
+        audio = resample(audio, rate, WHISPER_TARGET_SR)
+    return audio
+
+
+def _find_pauses(audio: np.ndarray, frame_ms: int = 30):
+    """Silent runs of at least VAD_MIN_PAUSE, from per-frame energy."""
+    n      = WHISPER_TARGET_SR * frame_ms // 1000
+    pcm    = (audio * 32767).astype("<i2")
+    energy = np.array([pcm_energy(pcm[i:i + n].tobytes()) for i in range(0, len(pcm) - n, n)])
+    quiet  = energy < max(np.percentile(energy, 20) * 4, 1.0)
+    pauses, start = [], None
+    for i, q in enumerate(quiet):
+        if q and start is None:
+            start = i
+        elif not q and start is not None:
+            if (i - start) * frame_ms / 1000 >= VAD_MIN_PAUSE:
+                pauses.append((start * n, i * n))
+            start = None
+    return pauses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("wav", type=Path)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--model", default=ASR_LONG_MODEL)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    from faster_whisper import WhisperModel
+
+    audio    = np.tile(_load_wav(args.wav), args.repeat)
+    duration = len(audio) / WHISPER_TARGET_SR
+    segments = plan_segments(len(audio), _find_pauses(audio))
+    print(f"Clip: {duration:.1f}s, {len(segments)} segments, {args.cores} cores, "
+          f"model '{args.model}'\n")
+    print(f"{'workers':>8} {'threads':>8} {'wall (s)':>10} {'RTF':>7} {'speed-up':>9}")
+
+    baseline = None
+    for workers in args.workers:
+        threads = max(args.cores // workers, 1)
+        model   = WhisperModel(
+            args.model, device=ASR_DEVICE, compute_type=ASR_COMPUTE_TYPE,
+            cpu_threads=threads, num_workers=workers,
+        )
+        _decode(model, audio[:WHISPER_TARGET_SR])          # warm-up
+
+        start = time.perf_counter()
+        if workers == 1:
+            _decode(model, audio)
+        else:
+            _decode_parallel(model, audio, segments, workers)
+        wall = time.perf_counter() - start
+
+        baseline = baseline or wall
+        print(f"{workers:>8} {threads:>8} {wall:>10.2f} {wall / duration:>7.3f} "
+              f"{baseline / wall:>8.2f}x")
+        del model
+
+
+if __name__ == "__main__":
+    main()
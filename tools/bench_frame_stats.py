@@ -0,0 +1,72 @@
+"""
+Micro-benchmark: per-frame cost of the recording loop's energy computation.
+
+Compares the original pure-Python `int.from_bytes` energy loop with the
+NumPy frame analysis in robojec.utils.frames.
+
+    python tools/bench_frame_stats.py [--frames 2000] [--frame-ms 100]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import SAMPLE_RATE                          # noqa: E402
+from robojec.utils.frames import frame_stats, pcm_energy  # noqa: E402
+
+
+def _pcm_energy_python(raw_data: bytes) -> float:
+    """The original implementation, kept here as the baseline."""
+    if not raw_data:
+        return 0.0
+    n = len(raw_data) // 2
+    return sum(
+        int.from_bytes(raw_data[i : i + 2], byteorder="little", signed=True) ** 2
+        for i in range(0, len(raw_data), 2)
+    ) / max(n, 1)
+
+
+def _time_per_frame(fn, frames) -> float:
+    start = time.perf_counter()
+    for raw in frames:
+        fn(raw)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--frame-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    n_samples = int(SAMPLE_RATE * args.frame_ms / 1000)
+    rng       = np.random.default_rng(0)
+    frames    = [
+        (rng.normal(0, 3000, n_samples)).clip(-32768, 32767).astype("<i2").tobytes()
+        for _ in range(args.frames)
+    ]
+
+    # sanity check: both paths agree
+    for raw in frames[:10]:
+        ref = _pcm_energy_python(raw)
+        assert abs(pcm_energy(raw) - ref) <= 1e-3 * ref, "energy mismatch"
+
+    py_cost    = _time_per_frame(_pcm_energy_python, frames[: max(args.frames // 10, 20)])
+    np_energy  = _time_per_frame(pcm_energy, frames)
+    np_stats   = _time_per_frame(frame_stats, frames)
+
+    print(f"{n_samples} samples/frame ({args.frame_ms:.0f} ms @ {SAMPLE_RATE} Hz)")
+    print(f"  python int.from_bytes energy : {py_cost * 1e6:9.1f} us/frame")
+    print(f"  numpy energy                 : {np_energy * 1e6:9.1f} us/frame "
+          f"({py_cost / np_energy:.0f}x)")
+    print(f"  numpy energy+peak+zcr        : {np_stats * 1e6:9.1f} us/frame "
+          f"({py_cost / np_stats:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: short-utterance recognition, Google SR vs local Whisper.
+
+Runs the same clip through `recognize_google` and through the local
+short-model path (ASR_SHORT_MODEL + SHORT_UTTERANCE_PROMPT) and prints
+median / p95 latency for each. By default Google is replaced by a local
+stub server that answers in Google's response format after a simulated
+round-trip, so the comparison is repeatable and works offline; pass
+--endpoint to hit a real or external endpoint instead.
+
+    python tools/bench_short_asr.py hello.wav [--runs 20] [--rtt-ms 350]
+                                              [--jitter-ms 150] [--endpoint URL]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import ASR_SHORT_MODEL, SHORT_UTTERANCE_PROMPT, WHISPER_TARGET_SR  # noqa: E402
+from robojec.utils.asr import _decode, get_model       # noqa: E402
+from robojec.utils.resample import resample            # noqa: E402
+
+
+def _stub_handler(rtt: float, jitter: float, transcript: str):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(max(rtt + random.uniform(-jitter, jitter), 0.0))
+            # Google's v2 API sends an empty result line before the real one
+            body = "\n".join([
+                json.dumps({"result": []}),
+                json.dumps({"result": [{"alternative": [
+                    {"transcript": transcript, "confidence": 0.9}
+                ], "final": True}], "result_index": 0}),
+            ]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _start_stub(rtt: float, jitter: float, transcript: str) -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _stub_handler(rtt, jitter, transcript))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/speech-api/v2/recognize"
+
+
+def _load_wav(path: Path):
+    with wave.open(str(path), "rb") as wf:
+        raw  = wf.readframes(wf.getnframes())
+        pcm  = np.frombuffer(raw, dtype="<i2").reshape(-1, wf.getnchannels())[:, 0]
+        rate = wf.getframerate()
+    audio = pcm.astype(np.float32) / 32768.0
+    if rate != WHISPER_TARGET_SR:
+        audio = resample(audio, rate, WHISPER_TARGET_SR)
+    pcm16 = np.clip(np.rint(audio * 32768.0), -32768, 32767).astype("<i2")
+    return audio, pcm16.tobytes()
+
+
+def _timed(fn, runs: int):
+    times, result = [], None
+    for _ in range(runs):
+        start  = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def _report(label: str, times, text) -> None:
+    p95 = sorted(times)[max(int(len(times) * 0.95) - 1, 0)]
+    print(f"{label:<22} median={statistics.median(times) * 1000:7.1f} ms  "
+          f"p95={p95 * 1000:7.1f} ms  → {text!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("wav", type=Path)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=350.0)
+    parser.add_argument("--jitter-ms", type=float, default=150.0)
+    parser.add_argument("--endpoint", default=None)
+    args = parser.parse_args()
+
+    import speech_recognition as sr
+
+    audio, raw = _load_wav(args.wav)
+    print(f"Clip: {len(audio) / WHISPER_TARGET_SR:.1f}s, {args.runs} runs each\n")
+
+    endpoint = args.endpoint or _start_stub(
+        args.rtt_ms / 1000, args.jitter_ms / 1000, "hello my name is"
+    )
+    recognizer = sr.Recognizer()
+    data       = sr.AudioData(raw, WHISPER_TARGET_SR, 2)
+    times, text = _timed(lambda: recognizer.recognize_google(data, endpoint=endpoint), args.runs)
+    _report("google" + ("" if args.endpoint else " (stub)"), times, text)
+
+    model = get_model(ASR_SHORT_MODEL)
+    times, text = _timed(lambda: _decode(model, audio, SHORT_UTTERANCE_PROMPT or None), args.runs)
+    _report(f"whisper '{ASR_SHORT_MODEL}'", times, text)
+
+
+if __name__ == "__main__":
+    main()
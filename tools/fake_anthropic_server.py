@@ -0,0 +1,143 @@
+"""
+Local stand-in for the Anthropic Messages API, for offline runs and tests.
+
+Answers POST /v1/messages with a canned reply, either as one JSON message or,
+when the request has "stream": true, as server-sent events with one text
+delta per word, after a configurable time-to-first-token and per-token delay.
+Point the app at it with
+
+    python tools/fake_anthropic_server.py --port 8765 &
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=test python main.py
+
+--check starts the server, streams one reply through the anthropic SDK and
+prints when the first sentence and the full reply arrived.
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_REPLY = (
+    "It's a pleasure to meet you. I'm RoboJEC, and I'm looking forward to our conversation. "
+    "Before we begin, may I have your name?"
+)
+
+
+def _handler(reply: str, first_token: float, per_token: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            model   = request.get("model", "fake-model")
+            words   = reply.split(" ")
+            tokens  = [w if i == 0 else " " + w for i, w in enumerate(words)]
+            usage   = {"input_tokens": 10, "output_tokens": len(tokens)}
+
+            if not request.get("stream"):
+                time.sleep(first_token + per_token * len(tokens))
+                self._send_json({
+                    "id": "msg_fake", "type": "message", "role": "assistant", "model": model,
+                    "content": [{"type": "text", "text": reply}],
+                    "stop_reason": "end_turn", "stop_sequence": None, "usage": usage,
+                })
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self._event("message_start", {"type": "message_start", "message": {
+                "id": "msg_fake", "type": "message", "role": "assistant", "model": model,
+                "content": [], "stop_reason": None, "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 1},
+            }})
+            self._event("content_block_start", {
+                "type": "content_block_start", "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            })
+            time.sleep(first_token)
+            for token in tokens:
+                self._event("content_block_delta", {
+                    "type": "content_block_delta", "index": 0,
+                    "delta": {"type": "text_delta", "text": token},
+                })
+                time.sleep(per_token)
+            self._event("content_block_stop", {"type": "content_block_stop", "index": 0})
+            self._event("message_delta", {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": len(tokens)},
+            })
+            self._event("message_stop", {"type": "message_stop"})
+            self.close_connection = True
+
+        def _send_json(self, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _event(self, name: str, data: dict) -> None:
+            self.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode())
+            self.wfile.flush()
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def serve(port: int = 0, reply: str = DEFAULT_REPLY,
+          first_token: float = 0.4, per_token: float = 0.05) -> ThreadingHTTPServer:
+    """Start the fake API on a daemon thread; returns the server (see .server_port)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(reply, first_token, per_token))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _check(server: ThreadingHTTPServer) -> None:
+    from anthropic import Anthropic
+
+    client = Anthropic(api_key="test", base_url=f"http://127.0.0.1:{server.server_port}")
+    start, first_sentence, text = time.perf_counter(), None, ""
+    with client.messages.stream(
+        model="fake-model", max_tokens=100, messages=[{"role": "user", "content": "hi"}],
+    ) as stream:
+        for delta in stream.text_stream:
+            text += delta
+            if first_sentence is None and any(p in text for p in ".!?"):
+                first_sentence = time.perf_counter() - start
+    total = time.perf_counter() - start
+    print(f"first sentence after {first_sentence:.2f}s, full reply after {total:.2f}s")
+    print(f"  {text}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--reply", default=DEFAULT_REPLY)
+    parser.add_argument("--first-token-ms", type=float, default=400.0)
+    parser.add_argument("--token-ms", type=float, default=50.0)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    server = serve(args.port, args.reply, args.first_token_ms / 1000, args.token_ms / 1000)
+    if args.check:
+        _check(server)
+        return
+    print(f"Fake Anthropic API on http://127.0.0.1:{server.server_port}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()